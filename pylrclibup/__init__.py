@@ -7,22 +7,32 @@ A tool to upload local LRC lyrics / instrumental markers to LRCLIB.net,
 based on track metadata from your music library (e.g. Jellyfin + MusicBrainz Picard).
 """
 
-from .config import AppConfig
-from .logging_utils import get_logger, set_log_level, log_info, log_warn, log_error
+from .logging_utils import get_logger, set_log_level, is_log_enabled, log_info, log_warn, log_error, flush_logs
 from .i18n import setup_i18n, get_text as _  # 新增
 
 __all__ = [
     "AppConfig",
     "get_logger",
     "set_log_level",
+    "is_log_enabled",
     "log_info",
     "log_warn",
     "log_error",
+    "flush_logs",
     "setup_i18n",  # 新增
     "_",            # 新增
 ]
 
 __version__ = "0.5.5"
 
+
+def __getattr__(name: str):
+    """按需导入 AppConfig（PEP 562），避免仅查看帮助时加载配置模块"""
+    if name == "AppConfig":
+        from .config import AppConfig
+        return AppConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # 默认初始化 i18n（自动检测语言）
 setup_i18n()
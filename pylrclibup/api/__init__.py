@@ -1,12 +1,21 @@
 """
 API 模块：与 LRCLIB 交互
-"""
 
-from .client import ApiClient
-from .publish import upload_lyrics, upload_instrumental
+子模块依赖 requests，按需导入（PEP 562），以免拖慢 CLI 启动。
+"""
 
 __all__ = [
     "ApiClient",
     "upload_lyrics",
     "upload_instrumental",
 ]
+
+
+def __getattr__(name: str):
+    if name == "ApiClient":
+        from .client import ApiClient
+        return ApiClient
+    if name in ("upload_lyrics", "upload_instrumental"):
+        from . import publish
+        return getattr(publish, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,113 @@
+# ===== api/cache.py =====
+
+"""
+本地响应缓存：把 /api/get* 的命中结果保存到 SQLite
+
+中断后重新运行、或反复处理同一目录时，近期查过的曲目无需再次请求 LRCLIB。
+只缓存命中的结果：未命中与请求失败在 http_request_json 中无法区分，不能当作结论保存。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from ..config import AppConfig
+from ..logging_utils import log_warn
+from ..i18n import get_text as _
+from .http import json_dumps, json_loads
+
+# 缓存文件名（位于 config.cache_dir 下）
+CACHE_FILENAME = "api.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+class ResponseCache:
+    """
+    线程安全的 SQLite 响应缓存（预取线程与主线程共用一个连接）
+
+    键为查询参数元组 (endpoint, track, artist, album, duration)；
+    超过 ttl 秒的条目视为不存在。SQLite 出错时只影响缓存本身，调用方照常请求网络。
+    """
+
+    def __init__(self, path: Path, ttl: float) -> None:
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # isolation_level=None：每条语句自动提交，不持有长事务
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute(_SCHEMA)
+
+    @staticmethod
+    def _digest(key: Tuple[Any, ...]) -> str:
+        raw = "\x1f".join(str(part) for part in key)
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        """读取未过期的缓存条目；不存在、已过期或读取失败时返回 None"""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload, fetched_at FROM responses WHERE key = ?",
+                    (self._digest(key),),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        try:
+            return json_loads(row[0])
+        except ValueError:
+            return None
+
+    def put(self, key: Tuple[Any, ...], data: Dict[str, Any]) -> None:
+        """写入（或覆盖）一条缓存"""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, endpoint, payload, fetched_at) VALUES (?, ?, ?, ?)",
+                    (self._digest(key), str(key[0]), json_dumps(data), time.time()),
+                )
+        except sqlite3.Error:
+            pass
+
+    def delete(self, key: Tuple[Any, ...]) -> None:
+        """删除一条缓存（上传后该曲目的查询结果已过期）"""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (self._digest(key),))
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_response_cache(config: AppConfig) -> Optional[ResponseCache]:
+    """
+    按配置打开本地响应缓存
+
+    未配置 cache_dir 时返回 None；缓存无法打开时给出警告并返回 None（本次运行不使用缓存）。
+    """
+    if config.cache_dir is None:
+        return None
+    path = config.cache_dir / CACHE_FILENAME
+    try:
+        return ResponseCache(path, config.cache_ttl)
+    except (OSError, sqlite3.Error) as e:
+        log_warn(_("无法打开本地响应缓存 {path}，本次运行不使用缓存：{error}").format(path=path, error=str(e)))
+        return None
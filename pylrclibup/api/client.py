@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from ..config import AppConfig
 from ..model import TrackMeta, LyricsRecord
-from ..logging_utils import log_info, log_warn
+from ..logging_utils import log_info, log_warn, is_log_enabled
 from ..i18n import get_text as _
 from .http import http_request_json
+from .cache import open_response_cache
 from .publish import (
     upload_lyrics as _upload_lyrics_impl,
     upload_instrumental as _upload_instrumental_impl,
@@ -23,13 +27,19 @@ def _check_duration(meta: TrackMeta, record: dict, label: str) -> None:
     if rec_dur is None:
         return
 
-    try:
-        rec_dur_int = int(round(float(rec_dur)))
-    except Exception:
-        return
+    # 常见情况：API 直接返回整数秒
+    if type(rec_dur) is int:
+        rec_dur_int = rec_dur
+    else:
+        try:
+            rec_dur_int = int(round(float(rec_dur)))
+        except (TypeError, ValueError, OverflowError):
+            return
 
     diff = abs(rec_dur_int - meta.duration)
     if diff <= 2:
+        if not is_log_enabled(logging.INFO):
+            return
         log_info(
             _("{label} 时长检查：LRCLIB={rec_dur}s, 本地={local_dur}s, 差值={diff}s（<=2s，符合匹配条件）").format(
                 label=label,
@@ -49,28 +59,66 @@ def _check_duration(meta: TrackMeta, record: dict, label: str) -> None:
         )
 
 
+# 查询键：(endpoint, track, artist, album, duration)
+LookupKey = Tuple[str, str, str, str, int]
+
+# 进程内缓存的最大条目数
+RESPONSE_CACHE_SIZE = 4096
+
+# 预取结果：endpoint -> 原始 JSON（None 表示未命中）；只包含实际请求过的 endpoint
+PrefetchResult = Dict[str, Optional[Dict[str, Any]]]
+
+
 class ApiClient:
     """
     高层 API 封装：
 
     - get_cached()  : 调用 /api/get-cached，只查内部数据库
     - get_external(): 调用 /api/get，会触发 LRCLIB 外部抓取
+    - lookup()      : 先查 /api/get-cached，未命中时再查 /api/get
+    - prefetch()    : 后台并发预取 lookup() 所需的查询
     - upload_lyrics(): 语义化包装 /api/publish（带歌词）
     - upload_instrumental(): 语义化包装 /api/publish（纯音乐）
     """
 
     def __init__(self, config: AppConfig) -> None:
         self.config = config
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[LookupKey, Future[PrefetchResult]] = {}
+        # 命中的原始 JSON（LyricsRecord 可变，每次取用时重新构造）
+        self._responses: Dict[LookupKey, Dict[str, Any]] = {}
+        # 跨运行的本地响应缓存（未配置或无法打开时为 None）
+        self._disk_cache = open_response_cache(config)
+        # close() 之后工作线程不再发起新的请求，尽快结束
+        self._closed = threading.Event()
 
-    def _api_get_common(
-        self,
-        meta: TrackMeta,
-        endpoint: str,
-        label: str,
-    ) -> Optional[LyricsRecord]:
+    @staticmethod
+    def _lookup_key(meta: TrackMeta, endpoint: str) -> LookupKey:
+        return (endpoint, meta.track, meta.artist, meta.album, meta.duration)
+
+    def _fetch(self, meta: TrackMeta, endpoint: str, label: str) -> Optional[Dict[str, Any]]:
         """
-        通用的 /api/get* 调用逻辑
+        获取 /api/get* 的原始 JSON（可在工作线程中执行）
+
+        先查本地响应缓存，未命中再请求网络；网络命中的结果写回本地缓存。
+        close() 之后不再请求网络，直接返回 None。
         """
+        disk_cache = self._disk_cache
+        key = self._lookup_key(meta, endpoint)
+        if disk_cache is not None:
+            data = disk_cache.get(key)
+            if data is not None:
+                return data
+
+        if self._closed.is_set():
+            return None
+        data = self._request(meta, endpoint, label)
+        if data and disk_cache is not None:
+            disk_cache.put(key, data)
+        return data
+
+    def _request(self, meta: TrackMeta, endpoint: str, label: str) -> Optional[Dict[str, Any]]:
+        """发起 /api/get* 请求，返回原始 JSON"""
         params = {
             "track_name": meta.track,
             "artist_name": meta.artist,
@@ -80,13 +128,37 @@ class ApiClient:
 
         url = f"{self.config.lrclib_base}/{endpoint}"
 
-        data = http_request_json(
+        return http_request_json(
             self.config,
             method="GET",
             url=url,
             label=label,
             params=params,
         )
+
+    def _api_get_common(
+        self,
+        meta: TrackMeta,
+        endpoint: str,
+        label: str,
+    ) -> Optional[LyricsRecord]:
+        """
+        通用的 /api/get* 调用逻辑
+
+        同一进程内相同参数的命中结果会被缓存；若该查询已被预取，
+        直接等待预取结果，不再重复请求。
+        """
+        key = self._lookup_key(meta, endpoint)
+        data = self._responses.get(key)
+        if data is None:
+            future = self._pending.pop(key, None)
+            prefetched = future.result() if future is not None else {}
+            if endpoint in prefetched:
+                data = prefetched[endpoint]
+            else:
+                data = self._fetch(meta, endpoint, label)
+            if data:
+                self._remember(key, data)
         if not data:
             return None
 
@@ -105,10 +177,105 @@ class ApiClient:
         """
         return self._api_get_common(meta, "get", _("外部抓取 (/api/get)"))
 
+    def lookup(
+        self,
+        meta: TrackMeta,
+        *,
+        allow_external: bool = True,
+    ) -> Tuple[Optional[LyricsRecord], bool]:
+        """
+        单一查询入口：/api/get-cached 命中即返回，只有未命中时才调用 /api/get
+
+        Returns:
+            (record, is_external)：record 为 None 表示两处都没有；
+            is_external 表示记录来自 /api/get
+        """
+        record = self.get_cached(meta)
+        if record or not allow_external:
+            # 预取时未请求 /api/get，丢弃对应的占位
+            self._pending.pop(self._lookup_key(meta, "get"), None)
+            return record, False
+        return self.get_external(meta), True
+
+    def _prefetch_lookup(self, meta: TrackMeta, allow_external: bool) -> PrefetchResult:
+        """
+        在工作线程中按 lookup() 的顺序请求：/api/get-cached 未命中时再请求 /api/get
+
+        工作线程的日志可能穿插在其他曲目的输出之间，label 中附带曲目以便区分。
+        """
+        track = f"[{meta.artist} - {meta.track}]"
+        cached_label = _("内部数据库 (/api/get-cached)")
+        result: PrefetchResult = {
+            "get-cached": self._fetch(meta, "get-cached", f"{cached_label} {track}"),
+        }
+        if not result["get-cached"] and allow_external:
+            external_label = _("外部抓取 (/api/get)")
+            result["get"] = self._fetch(meta, "get", f"{external_label} {track}")
+        return result
+
+    def prefetch(self, metas: Iterable[TrackMeta], *, allow_external: bool = True) -> None:
+        """
+        在后台线程池中并发预取 lookup() 所需的查询
+
+        每首歌一个任务，与 lookup() 相同：先查 /api/get-cached，未命中才查 /api/get。
+        结果暂存，直到对应的 get_cached()/get_external() 取用；
+        已在队列中或已缓存的查询不会重复提交。
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config.max_workers,
+                thread_name_prefix="pylrclibup-api",
+            )
+        for meta in metas:
+            key = self._lookup_key(meta, "get-cached")
+            if key in self._pending or key in self._responses:
+                continue
+            future = self._executor.submit(self._prefetch_lookup, meta, allow_external)
+            self._pending[key] = future
+            if allow_external:
+                self._pending[self._lookup_key(meta, "get")] = future
+
+    def _remember(self, key: LookupKey, data: Dict[str, Any]) -> None:
+        """缓存一次命中；超出容量时淘汰最早的条目"""
+        if len(self._responses) >= RESPONSE_CACHE_SIZE:
+            self._responses.pop(next(iter(self._responses)))
+        self._responses[key] = data
+
+    def _forget(self, meta: TrackMeta) -> None:
+        """丢弃该曲目的缓存与尚未取用的预取结果（上传后已过期）"""
+        for endpoint in ("get-cached", "get"):
+            key = self._lookup_key(meta, endpoint)
+            self._responses.pop(key, None)
+            future = self._pending.pop(key, None)
+            if future is not None:
+                future.cancel()
+            if self._disk_cache is not None:
+                self._disk_cache.delete(key)
+
+    def close(self) -> None:
+        """
+        关闭后台线程池与本地响应缓存，丢弃未完成的预取
+
+        不等待工作线程：排队中的任务直接取消，进行中的任务结束当前请求后
+        不再发起新请求，中途退出（Ctrl+C）时不必等完所有预取。
+        """
+        self._closed.set()
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+
     def upload_lyrics(self, meta: TrackMeta, plain: str, synced: str) -> bool:
         """高层包装：上传带 plain+synced 的歌词"""
+        self._forget(meta)
         return _upload_lyrics_impl(self.config, meta, plain, synced)
 
     def upload_instrumental(self, meta: TrackMeta) -> bool:
         """高层包装：以"纯音乐"方式上传"""
+        self._forget(meta)
         return _upload_instrumental_impl(self.config, meta)
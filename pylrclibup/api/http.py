@@ -2,32 +2,178 @@
 
 from __future__ import annotations
 
+import functools
+import json
 import random
 import time
 from typing import Optional, Dict, Any
 
 import requests
 from requests import RequestException
+from requests.adapters import HTTPAdapter
+
+try:  # 可选加速依赖：pip install "pylrclibup[speedups]"
+    import orjson
+except ImportError:  # pragma: no cover - 取决于安装环境
+    orjson = None
 
 from ..config import AppConfig
 from ..logging_utils import log_info, log_warn, log_error
 from ..i18n import get_text as _
 
 
-def _calculate_backoff(attempt: int, base: float = 1.0, max_delay: float = 30.0) -> float:
+# 连接池：同一进程内复用 TCP/TLS 连接（keep-alive）
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 16
+
+# 建立连接的超时（秒）；读取超时由调用方的 timeout 决定
+HTTP_CONNECT_TIMEOUT = 5
+
+# 可重试的 4xx：请求超时 / 限流
+RETRIABLE_4XX_STATUS = frozenset({408, 429})
+
+# 日志中附带的响应体片段长度（字节）
+BODY_SNIPPET_BYTES = 200
+
+# 释放响应时，不超过该长度（字节）的剩余响应体会被读完以复用连接
+DRAIN_MAX_BYTES = 4096
+
+
+@functools.lru_cache(maxsize=None)
+def get_session(user_agent: str) -> requests.Session:
+    """
+    获取进程内共享的 requests.Session（按 User-Agent 各一个）
+
+    挂载带连接池的 HTTPAdapter，避免每次请求都重新握手；
+    重试由调用方自行控制，因此 max_retries=0。
+    User-Agent 在整个运行期间不变，直接设为会话默认请求头。
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = user_agent
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# 发送 JSON 请求体时附加的请求头（User-Agent 已由会话提供）
+JSON_HEADERS: Dict[str, str] = {"Content-Type": "application/json"}
+
+
+def json_loads(data: bytes) -> Any:
+    """解析 JSON 字节串：安装了 orjson 时使用 orjson，否则回退到标准库"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """将对象编码为 UTF-8 JSON 字节串（用于只编码一次、重试时复用的请求体）"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def release_response(resp: requests.Response) -> None:
+    """
+    不再需要响应体时释放响应
+
+    stream=True 下，直接 close() 未读完的响应会丢弃底层连接；
+    声明长度不超过 DRAIN_MAX_BYTES 的响应体先读完，连接即可回到连接池复用，
+    更大或长度未知的响应体则直接关闭，不为它多等网络。
+    """
+    try:
+        length = int(resp.headers.get("Content-Length", ""))
+    except (TypeError, ValueError):
+        length = None
+    try:
+        if length is not None and length <= DRAIN_MAX_BYTES:
+            resp.content
+    except RequestException:
+        pass
+    finally:
+        resp.close()
+
+
+def body_snippet(resp: requests.Response) -> str:
+    """
+    读取响应体开头的一小段用于日志，随后释放响应
+
+    配合 stream=True 使用：错误页可能很大，只解码前 BODY_SNIPPET_BYTES 字节。
+    """
+    try:
+        if resp.raw is None:
+            return resp.text[:BODY_SNIPPET_BYTES]
+        raw = resp.raw.read(BODY_SNIPPET_BYTES, decode_content=True) or b""
+        return raw.decode(resp.encoding or "utf-8", errors="replace")
+    except Exception:
+        return ""
+    finally:
+        release_response(resp)
+
+
+def calculate_backoff(config: AppConfig, attempt: int) -> float:
     """
-    计算指数退避延迟时间（带抖动）
-    
+    计算截断指数退避延迟时间（带抖动）
+
+    delay = min(max_delay, base * 2^(attempt-1)) * (1 + U(0, jitter))
+
     Args:
+        config: 提供 retry_base_delay / retry_max_delay / retry_jitter
         attempt: 当前重试次数（从 1 开始）
-        base: 基础延迟时间
-        max_delay: 最大延迟时间
-    
+
     Returns:
         延迟秒数
     """
-    delay = min(base * (2 ** (attempt - 1)) + random.uniform(0, 1), max_delay)
-    return delay
+    delay = min(config.retry_max_delay, config.retry_base_delay * (2 ** (attempt - 1)))
+    return delay * (1 + random.random() * config.retry_jitter)
+
+
+def retry_delay(config: AppConfig, attempt: int, resp: Optional[requests.Response] = None) -> float:
+    """
+    决定下一次重试前的等待时间
+
+    若响应带有 Retry-After（秒数），优先采用（不超过 retry_max_delay），
+    否则使用指数退避。
+    """
+    if resp is not None:
+        retry_after = resp.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), config.retry_max_delay)
+            except ValueError:
+                pass
+    return calculate_backoff(config, attempt)
+
+
+def _retry_after_error(
+    config: AppConfig,
+    label: str,
+    attempt: int,
+    retries: int,
+    error: RequestException,
+) -> bool:
+    """
+    记录一次网络异常；还有剩余次数时等待退避时间并返回 True（调用方继续重试）
+    """
+    backoff = calculate_backoff(config, attempt)
+    log_warn(
+        _("{label} 调用失败（第 {attempt}/{retries} 次），等待 {backoff:.1f}s 后重试: {error}").format(
+            label=label,
+            attempt=attempt,
+            retries=retries,
+            backoff=backoff,
+            error=str(error)
+        )
+    )
+    if attempt == retries:
+        return False
+    time.sleep(backoff)
+    return True
 
 
 def http_request_json(
@@ -38,6 +184,7 @@ def http_request_json(
     *,
     params: Optional[Dict[str, Any]] = None,
     json_data: Optional[Dict[str, Any]] = None,
+    data: Optional[bytes] = None,
     timeout: int = 20,
     max_retries: Optional[int] = None,
     treat_404_as_none: bool = True,
@@ -46,74 +193,80 @@ def http_request_json(
     封装 GET / POST JSON 请求的通用函数：
 
     - 遵循 config.max_http_retries 进行重试
-    - 对网络异常 / 5xx 做自动重试（使用指数退避）
+    - json_data 只编码一次，重试时复用同一份字节（也可直接传入已编码的 data）
+    - 每次尝试分别限制连接超时（HTTP_CONNECT_TIMEOUT）与读取超时（timeout）
+    - 对网络异常 / 5xx 做自动重试（截断指数退避 + 抖动，遵循 Retry-After）
     - 404 可选视为 None
-    - 其余 4xx 报错后不重试
+    - 408/429 视为暂时性错误并重试，其余 4xx 报错后不重试
     """
     retries = max_retries if max_retries is not None else config.max_http_retries
 
+    if json_data is not None and data is None:
+        data = json_dumps(json_data)
+    headers = JSON_HEADERS if data is not None else None
+
     for attempt in range(1, retries + 1):
         try:
-            resp = requests.request(
-                method=method,
-                url=url,
+            resp = get_session(config.user_agent).request(
+                method,
+                url,
                 params=params,
-                json=json_data,
-                timeout=timeout,
-                headers={"User-Agent": config.user_agent},
+                data=data,
+                timeout=(HTTP_CONNECT_TIMEOUT, timeout),
+                headers=headers,
+                stream=True,
             )
         except RequestException as e:
-            backoff = _calculate_backoff(attempt)
-            log_warn(
-                _("{label} 调用失败（第 {attempt}/{retries} 次），等待 {backoff:.1f}s 后重试: {error}").format(
-                    label=label,
-                    attempt=attempt,
-                    retries=retries,
-                    backoff=backoff,
-                    error=str(e)
-                )
-            )
-            if attempt == retries:
+            if not _retry_after_error(config, label, attempt, retries, e):
                 return None
-            time.sleep(backoff)
             continue
 
         # 特殊处理 404
         if resp.status_code == 404 and treat_404_as_none:
+            release_response(resp)
             return None
 
         if 200 <= resp.status_code < 300:
+            # stream=True：响应体在此处才读取，读取中断（连接断开、超时等）同样重试
+            try:
+                body = resp.content
+            except RequestException as e:
+                # 响应体已损坏，无需排空，直接关闭（连接不可复用）
+                resp.close()
+                if not _retry_after_error(config, label, attempt, retries, e):
+                    return None
+                continue
             try:
-                return resp.json()
-            except ValueError as e:
+                return json_loads(body)
+            except ValueError as e:  # orjson.JSONDecodeError 也是 ValueError
                 log_warn(
                     _("{label} 解析 JSON 失败: {error} (status={status}, body={body})").format(
                         label=label,
                         error=str(e),
                         status=resp.status_code,
-                        body=resp.text[:200]
+                        body=body[:BODY_SNIPPET_BYTES].decode("utf-8", errors="replace")
                     )
                 )
                 return None
 
-        # 4xx 默认认为是参数/认证问题，不重试
-        if 400 <= resp.status_code < 500:
+        # 4xx 默认认为是参数/认证问题，不重试（408/429 除外）
+        if 400 <= resp.status_code < 500 and resp.status_code not in RETRIABLE_4XX_STATUS:
             log_warn(
                 _("{label} 请求失败：HTTP {status}, body={body}").format(
                     label=label,
                     status=resp.status_code,
-                    body=resp.text[:200]
+                    body=body_snippet(resp)
                 )
             )
             return None
 
-        # 5xx → 重试
-        backoff = _calculate_backoff(attempt)
+        # 5xx / 408 / 429 → 重试（429/503 可能带 Retry-After）
+        backoff = retry_delay(config, attempt, resp)
         log_warn(
             _("{label} 请求失败：HTTP {status}, body={body}（第 {attempt}/{retries} 次），等待 {backoff:.1f}s 后重试").format(
                 label=label,
                 status=resp.status_code,
-                body=resp.text[:200],
+                body=body_snippet(resp),
                 attempt=attempt,
                 retries=retries,
                 backoff=backoff
@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
-import random
 import time
 from typing import Optional, Dict, Any
 
-import requests
 from requests import RequestException
 
 from ..config import AppConfig
 from ..model import TrackMeta
 from ..logging_utils import log_info, log_warn, log_error
 from ..i18n import get_text as _
-from .http import http_request_json
+from .http import (
+    http_request_json,
+    get_session,
+    calculate_backoff,
+    retry_delay,
+    RETRIABLE_4XX_STATUS,
+    HTTP_CONNECT_TIMEOUT,
+    body_snippet,
+    release_response,
+    json_dumps,
+    JSON_HEADERS,
+)
 from .pow import solve_pow
 
 
@@ -54,11 +63,6 @@ def request_publish_token(config: AppConfig) -> Optional[str]:
 # -------------------- Publish with retry --------------------
 
 
-def _calculate_backoff(attempt: int, base: float = 1.0, max_delay: float = 30.0) -> float:
-    """计算指数退避延迟时间（带抖动）"""
-    return min(base * (2 ** (attempt - 1)) + random.uniform(0, 1), max_delay)
-
-
 def publish_with_retry(
     config: AppConfig,
     meta: TrackMeta,
@@ -69,15 +73,17 @@ def publish_with_retry(
     对 /api/publish 做一层自动重试：
       - 每次重试都会重新请求 challenge + 重新 PoW
       - 成功（201）即返回 True
-      - 4xx 认为是参数或 Token 问题，不重试
+      - 4xx 认为是参数或 Token 问题，不重试（408/429 限流类除外）
     """
     url = f"{config.lrclib_base}/publish"
     retries = config.max_http_retries
+    # 请求体只编码一次，每次重试复用
+    body = json_dumps(payload)
 
     for attempt in range(1, retries + 1):
         token = request_publish_token(config)
         if not token:
-            backoff = _calculate_backoff(attempt)
+            backoff = calculate_backoff(config, attempt)
             log_warn(
                 _("{label}：获取发布令牌失败（第 {attempt}/{retries} 次），等待 {backoff:.1f}s 后重试").format(
                     label=label,
@@ -93,14 +99,19 @@ def publish_with_retry(
 
         headers = {
             "X-Publish-Token": token,
-            "Content-Type": "application/json",
-            "User-Agent": config.user_agent,
+            **JSON_HEADERS,
         }
 
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=30)
+            resp = get_session(config.user_agent).post(
+                url,
+                data=body,
+                headers=headers,
+                timeout=(HTTP_CONNECT_TIMEOUT, 30),
+                stream=True,
+            )
         except RequestException as e:
-            backoff = _calculate_backoff(attempt)
+            backoff = calculate_backoff(config, attempt)
             log_warn(
                 _("{label} (/api/publish) 调用失败（第 {attempt}/{retries} 次），等待 {backoff:.1f}s 后重试: {error}").format(
                     label=label,
@@ -116,26 +127,27 @@ def publish_with_retry(
             continue
 
         if resp.status_code == 201:
+            release_response(resp)
             return True
 
-        # 4xx: 参数/Token 错误，不再重试
-        if 400 <= resp.status_code < 500:
+        # 4xx: 参数/Token 错误，不再重试（408/429 除外）
+        if 400 <= resp.status_code < 500 and resp.status_code not in RETRIABLE_4XX_STATUS:
             log_error(
                 _("{label} 失败：HTTP {status}, body={body}（4xx 错误，一般是参数或 Token 问题，不再重试）").format(
                     label=label,
                     status=resp.status_code,
-                    body=resp.text[:200]
+                    body=body_snippet(resp)
                 )
             )
             return False
 
-        # 5xx: 重试
-        backoff = _calculate_backoff(attempt)
+        # 5xx / 408 / 429: 重试（429/503 可能带 Retry-After）
+        backoff = retry_delay(config, attempt, resp)
         log_warn(
             _("{label} 失败：HTTP {status}, body={body}（第 {attempt}/{retries} 次），等待 {backoff:.1f}s 后重试").format(
                 label=label,
                 status=resp.status_code,
-                body=resp.text[:200],
+                body=body_snippet(resp),
                 attempt=attempt,
                 retries=retries,
                 backoff=backoff
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import sys
 from pathlib import Path
+from typing import Dict, List, Optional
 
 from ..config import AppConfig
-from ..processor import process_all
 from ..logging_utils import log_info, log_error
-from ..i18n import setup_i18n, get_text as _
+from ..i18n import setup_i18n, get_locale, get_text as _
 
 
 def _detect_lang_from_argv() -> str:
@@ -34,6 +35,42 @@ def _detect_lang_from_argv() -> str:
     return 'auto'
 
 
+def _resolve_dirs(*values: Optional[str]) -> List[Optional[Path]]:
+    """
+    解析用户提供的目录参数
+
+    未提供的参数保持 None（交给环境变量/默认值）；相同的路径只 resolve 一次，
+    例如 --tracks 与 --lrc 指向同一目录时。
+    """
+    resolved: Dict[str, Path] = {}
+    result: List[Optional[Path]] = []
+    for value in values:
+        if not value:
+            result.append(None)
+            continue
+        if value not in resolved:
+            resolved[value] = Path(value).resolve()
+        result.append(resolved[value])
+    return result
+
+
+# 快捷模式冲突表：(args 属性, 参数名, 是否禁止路径参数)
+_MODE_CONFLICTS = (
+    ("default", "-d/--default", True),
+    ("match", "-m/--match", False),
+)
+
+# 快捷模式已隐含的行为开关：(args 属性, 参数名)
+_MODE_FLAG_CONFLICTS = (
+    ("follow", "-f/--follow"),
+    ("rename", "-r/--rename"),
+    ("cleanse", "-c/--cleanse"),
+)
+
+# 路径参数（args 属性）
+_PATH_ARGS = ("tracks", "lrc", "done_tracks", "done_lrc")
+
+
 def validate_args(args) -> None:
     """验证命令行参数的冲突规则"""
     # 规则 1：--follow 与 --done-lrc 冲突
@@ -48,52 +85,29 @@ def validate_args(args) -> None:
         sys.exit(1)
     
     # 规则 3 & 4：快捷模式与其他参数冲突
-    if args.default:
-        conflicts = []
-        if args.follow:
-            conflicts.append("-f/--follow")
-        if args.rename:
-            conflicts.append("-r/--rename")
-        if args.cleanse:
-            conflicts.append("-c/--cleanse")
-        if args.tracks or args.lrc or args.done_tracks or args.done_lrc:
+    for mode, mode_label, forbid_paths in _MODE_CONFLICTS:
+        if not getattr(args, mode):
+            continue
+        conflicts = [label for attr, label in _MODE_FLAG_CONFLICTS if getattr(args, attr)]
+        if forbid_paths and any(getattr(args, attr) for attr in _PATH_ARGS):
             conflicts.append(_("路径参数"))
         
         if conflicts:
-            log_error(_("错误：-d/--default 模式不能与以下参数同时使用：{conflicts}").format(
-                conflicts=', '.join(conflicts)
-            ))
-            sys.exit(1)
-    
-    if args.match:
-        conflicts = []
-        if args.follow:
-            conflicts.append("-f/--follow")
-        if args.rename:
-            conflicts.append("-r/--rename")
-        if args.cleanse:
-            conflicts.append("-c/--cleanse")
-        
-        if conflicts:
-            log_error(_("错误：-m/--match 模式不能与以下参数同时使用：{conflicts}").format(
+            log_error(_("错误：{mode} 模式不能与以下参数同时使用：{conflicts}").format(
+                mode=mode_label,
                 conflicts=', '.join(conflicts)
             ))
             sys.exit(1)
 
 
-def run_cli():
+@functools.lru_cache(maxsize=None)
+def _build_parser(locale: str) -> argparse.ArgumentParser:
     """
-    pylrclibup 的命令行入口点。
+    构建命令行解析器
+
+    help 文本在构建时翻译，因此按语言缓存：同一进程内重复调用 run_cli()
+    不会重复构建。
     """
-    
-    # ========== 🌍 提前初始化 i18n ==========
-    detected_lang = _detect_lang_from_argv()
-    if detected_lang != 'auto':
-        setup_i18n(locale=detected_lang)
-    else:
-        setup_i18n()  # 自动检测系统语言
-    
-    # ========== 创建 ArgumentParser ==========
     parser = argparse.ArgumentParser(
         prog="pylrclibup",
         description=_("将本地歌词文件或纯音乐标记上传到 LRCLIB。")
@@ -143,7 +157,13 @@ def run_cli():
         "--preview-lines",
         type=int,
         default=10,
-        help=_("预览歌词时显示的行数")
+        help=_("预览歌词时显示的行数（0 表示不预览）")
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=_("不使用本地响应缓存（默认缓存 LRCLIB 查询命中结果 7 天，目录可用 PYLRCLIBUP_CACHE_DIR 指定）")
     )
 
     # -------------------- 快捷模式 --------------------
@@ -175,7 +195,22 @@ def run_cli():
         help=_("界面语言：zh_CN（简体中文）/ en_US（English）/ auto（自动检测）"),
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def run_cli():
+    """
+    pylrclibup 的命令行入口点。
+    """
+    
+    # ========== 🌍 提前初始化 i18n ==========
+    detected_lang = _detect_lang_from_argv()
+    if detected_lang != 'auto':
+        setup_i18n(locale=detected_lang)
+    else:
+        setup_i18n()  # 自动检测系统语言
+    
+    args = _build_parser(get_locale()).parse_args()
 
     # ========== 参数冲突检查 ==========
     validate_args(args)
@@ -184,10 +219,7 @@ def run_cli():
     
     # 处理 -d/--default 模式
     if args.default:
-        tracks_arg, lrc_arg = args.default
-        
-        tracks_dir = Path(tracks_arg).resolve()
-        lrc_dir = Path(lrc_arg).resolve()
+        tracks_dir, lrc_dir = _resolve_dirs(*args.default)
         done_tracks_dir = None
         done_lrc_dir = None
         follow_mp3 = True
@@ -196,9 +228,9 @@ def run_cli():
     
     # 处理 -m/--match 模式
     elif args.match:
-        tracks_dir = Path(args.tracks).resolve() if args.tracks else None
-        lrc_dir = Path(args.lrc).resolve() if args.lrc else None
-        done_tracks_dir = Path(args.done_tracks).resolve() if args.done_tracks else None
+        tracks_dir, lrc_dir, done_tracks_dir = _resolve_dirs(
+            args.tracks, args.lrc, args.done_tracks
+        )
         done_lrc_dir = None
         follow_mp3 = True
         rename_lrc = True
@@ -206,10 +238,9 @@ def run_cli():
     
     # 普通模式
     else:
-        tracks_dir = Path(args.tracks).resolve() if args.tracks else None
-        lrc_dir = Path(args.lrc).resolve() if args.lrc else None
-        done_tracks_dir = Path(args.done_tracks).resolve() if args.done_tracks else None
-        done_lrc_dir = Path(args.done_lrc).resolve() if args.done_lrc else None
+        tracks_dir, lrc_dir, done_tracks_dir, done_lrc_dir = _resolve_dirs(
+            args.tracks, args.lrc, args.done_tracks, args.done_lrc
+        )
         follow_mp3 = args.follow
         rename_lrc = args.rename
         cleanse_lrc = args.cleanse
@@ -224,11 +255,16 @@ def run_cli():
         rename_lrc=rename_lrc,
         cleanse_lrc=cleanse_lrc,
         preview_lines=args.preview_lines,
+        no_cache=args.no_cache,
     )
 
+    # 延迟导入：处理流程依赖 requests / mutagen，--help 与参数校验阶段无需加载
+    from ..processor import process_all
+
     # 执行处理
     try:
         process_all(config)
     except KeyboardInterrupt:
-        print("\n" + _("[信息] 用户中断执行（Ctrl+C），已优雅退出。"))
+        print()
+        log_info(_("用户中断执行（Ctrl+C），已优雅退出。"))
         sys.exit(0)
@@ -19,19 +19,39 @@ PREVIEW_LINES_DEFAULT = 10
 # HTTP 调用最大自动重试次数
 MAX_HTTP_RETRIES_DEFAULT = 5
 
+# HTTP 重试退避：首次延迟 / 延迟上限 / 抖动比例
+RETRY_BASE_DELAY_DEFAULT = 0.5
+RETRY_MAX_DELAY_DEFAULT = 30.0
+RETRY_JITTER_DEFAULT = 0.5
+
+# 后台并发网络请求的线程数
+MAX_WORKERS_DEFAULT = 8
+
+# 本地响应缓存的有效期（秒）
+CACHE_TTL_DEFAULT = 7 * 24 * 3600
+
 # 默认 User-Agent
 DEFAULT_USER_AGENT = "pylrclibup (https://github.com/Harmonese/pylrclibup)"
 
-# 支持的音频文件扩展名
-SUPPORTED_AUDIO_EXTENSIONS = {".mp3", ".m4a", ".aac", ".flac", ".wav"}
+# 支持的音频文件扩展名（小写、带点；frozenset 供扫描时 O(1) 判断）
+SUPPORTED_AUDIO_EXTENSIONS = frozenset({".mp3", ".m4a", ".aac", ".flac", ".wav"})
 
 # 支持的 YAML 元数据扩展名
-SUPPORTED_YAML_EXTENSIONS = {".yaml", ".yml"}
+SUPPORTED_YAML_EXTENSIONS = frozenset({".yaml", ".yml"})
+
+# -------------------- 环境变量 --------------------
+
+
+def _env_int(name: str, default: int) -> int:
+    """读取非负整数环境变量；未设置或不是纯数字时返回默认值"""
+    value = os.getenv(name)
+    return int(value) if value and value.isdigit() else default
+
 
 # -------------------- AppConfig --------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """
     全局配置对象：
@@ -48,9 +68,12 @@ class AppConfig:
     - cleanse_lrc: 处理前是否标准化 LRC 文件
 
     其他配置：
-    - preview_lines: 预览歌词时显示的最大行数
+    - preview_lines: 预览歌词时显示的最大行数（<= 0 表示不预览）
     - max_http_retries: HTTP 自动重试次数
+    - retry_base_delay / retry_max_delay / retry_jitter: 重试的指数退避参数
+    - max_workers: 后台并发网络请求的线程数
     - user_agent: 发送给 LRCLIB 的 User-Agent
+    - cache_dir / cache_ttl: 本地响应缓存目录（None = 不缓存）及有效期（秒）
     """
 
     tracks_dir: Path
@@ -64,8 +87,15 @@ class AppConfig:
 
     preview_lines: int = PREVIEW_LINES_DEFAULT
     max_http_retries: int = MAX_HTTP_RETRIES_DEFAULT
+    retry_base_delay: float = RETRY_BASE_DELAY_DEFAULT
+    retry_max_delay: float = RETRY_MAX_DELAY_DEFAULT
+    retry_jitter: float = RETRY_JITTER_DEFAULT
+    max_workers: int = MAX_WORKERS_DEFAULT
     user_agent: str = DEFAULT_USER_AGENT
 
+    cache_dir: Optional[Path] = None  # None = 不使用本地响应缓存
+    cache_ttl: float = CACHE_TTL_DEFAULT
+
     lrclib_base: str = LRCLIB_BASE
 
     # -------------------- 便捷属性（向后兼容） --------------------
@@ -101,6 +131,8 @@ class AppConfig:
         preview_lines: Optional[int] = None,
         max_http_retries: Optional[int] = None,
         user_agent: Optional[str] = None,
+        cache_dir: Optional[str | Path] = None,
+        no_cache: bool = False,
     ) -> "AppConfig":
         """
         统一入口：综合考虑
@@ -126,6 +158,9 @@ class AppConfig:
         # 解析 User-Agent
         ua = user_agent or os.getenv("PYLRCLIBUP_USER_AGENT") or DEFAULT_USER_AGENT
 
+        # 解析本地响应缓存目录
+        cache = None if no_cache else cls._resolve_cache_dir(cache_dir)
+
         return cls(
             tracks_dir=tracks,
             lrc_dir=lrc,
@@ -137,6 +172,7 @@ class AppConfig:
             preview_lines=preview_lines_val,
             max_http_retries=max_retries_val,
             user_agent=ua,
+            cache_dir=cache,
         )
 
     @staticmethod
@@ -145,15 +181,16 @@ class AppConfig:
         lrc_dir: Optional[str | Path],
     ) -> tuple[Path, Path]:
         """解析输入目录（tracks 和 lrc）"""
-        cwd = Path.cwd()
+        # 只在未显式传入时才查询环境变量 / 当前目录
+        tracks = tracks_dir or os.getenv("PYLRCLIBUP_TRACKS_DIR")
+        lrc = lrc_dir or os.getenv("PYLRCLIBUP_LRC_DIR")
         
-        env_tracks = os.getenv("PYLRCLIBUP_TRACKS_DIR")
-        env_lrc = os.getenv("PYLRCLIBUP_LRC_DIR")
+        if not tracks or not lrc:
+            cwd = Path.cwd()
+            tracks = tracks or cwd
+            lrc = lrc or cwd
         
-        tracks = Path(tracks_dir or env_tracks or cwd)
-        lrc = Path(lrc_dir or env_lrc or cwd)
-        
-        return tracks, lrc
+        return Path(tracks), Path(lrc)
 
     @staticmethod
     def _resolve_output_dirs(
@@ -168,48 +205,46 @@ class AppConfig:
         Returns:
             (done_tracks, done_lrc)
         """
-        env_done_tracks = os.getenv("PYLRCLIBUP_DONE_TRACKS_DIR")
-        env_done_lrc = os.getenv("PYLRCLIBUP_DONE_LRC_DIR")
-        
-        # 设置 done 目录（None 表示原地不动）
-        done_tracks = None
-        if done_tracks_dir:
-            done_tracks = Path(done_tracks_dir)
-        elif env_done_tracks:
-            done_tracks = Path(env_done_tracks)
+        # 设置 done 目录（None 表示原地不动；显式传入时不再查询环境变量）
+        done_tracks = done_tracks_dir or os.getenv("PYLRCLIBUP_DONE_TRACKS_DIR")
+        done_lrc = done_lrc_dir or os.getenv("PYLRCLIBUP_DONE_LRC_DIR")
         
-        done_lrc = None
-        if done_lrc_dir:
-            done_lrc = Path(done_lrc_dir)
-        elif env_done_lrc:
-            done_lrc = Path(env_done_lrc)
-        
-        return done_tracks, done_lrc
+        return (
+            Path(done_tracks) if done_tracks else None,
+            Path(done_lrc) if done_lrc else None,
+        )
+
+    @staticmethod
+    def _resolve_cache_dir(cache_dir: Optional[str | Path]) -> Path:
+        """
+        解析本地响应缓存目录
+
+        优先级：参数 > PYLRCLIBUP_CACHE_DIR > $XDG_CACHE_HOME（Windows 为 %LOCALAPPDATA%）/pylrclibup
+        > ~/.cache/pylrclibup
+        """
+        explicit = cache_dir or os.getenv("PYLRCLIBUP_CACHE_DIR")
+        if explicit:
+            return Path(explicit)
+        base = os.getenv("XDG_CACHE_HOME") or (os.getenv("LOCALAPPDATA") if os.name == "nt" else None)
+        if base:
+            return Path(base) / "pylrclibup"
+        return Path.home() / ".cache" / "pylrclibup"
 
     @staticmethod
     def _resolve_numeric_config(
         preview_lines: Optional[int],
         max_http_retries: Optional[int],
     ) -> tuple[int, int]:
-        """解析数值类配置"""
-        # preview_lines
-        if preview_lines is None:
-            env_preview = os.getenv("PYLRCLIBUP_PREVIEW_LINES")
-            if env_preview and env_preview.isdigit():
-                preview_lines_val = int(env_preview)
-            else:
-                preview_lines_val = PREVIEW_LINES_DEFAULT
-        else:
-            preview_lines_val = preview_lines
-        
-        # max_http_retries
-        if max_http_retries is None:
-            env_retries = os.getenv("PYLRCLIBUP_MAX_HTTP_RETRIES")
-            if env_retries and env_retries.isdigit():
-                max_retries_val = int(env_retries)
-            else:
-                max_retries_val = MAX_HTTP_RETRIES_DEFAULT
-        else:
-            max_retries_val = max_http_retries
+        """解析数值类配置（显式传入时不读取环境变量）"""
+        preview_lines_val = (
+            preview_lines
+            if preview_lines is not None
+            else _env_int("PYLRCLIBUP_PREVIEW_LINES", PREVIEW_LINES_DEFAULT)
+        )
+        max_retries_val = (
+            max_http_retries
+            if max_http_retries is not None
+            else _env_int("PYLRCLIBUP_MAX_HTTP_RETRIES", MAX_HTTP_RETRIES_DEFAULT)
+        )
         
         return preview_lines_val, max_retries_val
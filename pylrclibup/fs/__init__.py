@@ -4,8 +4,10 @@
 
 from .mover import move_with_dedup
 from .cleaner import cleanup_empty_dirs
+from .scanner import iter_files
 
 __all__ = [
     "move_with_dedup",
     "cleanup_empty_dirs",
+    "iter_files",
 ]
@@ -2,34 +2,66 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import List
 
+from .mover import forget_known_dirs
 from ..logging_utils import log_info, log_warn
 from ..i18n import get_text as _
 
 
+def _walk_dirs_bottom_up(root: str) -> List[str]:
+    """
+    列出 root 下所有子目录（不含 root），子目录排在父目录之前
+
+    基于 os.scandir：DirEntry.is_dir() 直接使用目录读取时得到的类型信息，
+    无需逐项 stat；不进入符号链接目录。
+    """
+    dirs: List[str] = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    # 先序收集：父目录总在其子目录之前，反转即为自底向上
+    dirs.reverse()
+    return dirs
+
+
+def _is_empty_dir(path: str) -> bool:
+    with os.scandir(path) as it:
+        return next(it, None) is None
+
+
 def cleanup_empty_dirs(root: Path) -> None:
     """
     递归删除 root 下的空目录（不删除 root 本身）
     
     采用自底向上的方式，确保子目录先于父目录被检查
     """
-    if not root.exists() or not root.is_dir():
+    if not root.is_dir():
         return
     
-    # 收集所有子目录（自底向上排序）
-    all_dirs = sorted(root.rglob("*"), key=lambda p: len(p.parts), reverse=True)
-    
-    for d in all_dirs:
-        if not d.is_dir():
-            continue
-        
+    removed = False
+    for d in _walk_dirs_bottom_up(str(root)):
         try:
             # 检查目录是否为空
-            if not any(d.iterdir()):
-                d.rmdir()
+            if _is_empty_dir(d):
+                os.rmdir(d)
+                removed = True
                 log_info(_("已删除空目录：{dir}").format(dir=d))
         except PermissionError:
             log_warn(_("无权限删除目录：{dir}").format(dir=d))
         except OSError as e:
             log_warn(_("删除目录失败 {dir}: {error}").format(dir=d, error=str(e)))
+    
+    # 已删除的目录可能在 move_with_dedup 的目录缓存中
+    if removed:
+        forget_known_dirs()
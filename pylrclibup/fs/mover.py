@@ -2,13 +2,51 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 
 from ..logging_utils import log_warn
 from ..i18n import get_text as _
 
 
+# 本进程内已确认存在的目录：批量移动到同一目录时只需 mkdir 一次
+_known_dirs: Set[Path] = set()
+
+
+def ensure_dir(d: Path) -> None:
+    """确保目录存在（同一目录只创建/检查一次）"""
+    if d not in _known_dirs:
+        d.mkdir(parents=True, exist_ok=True)
+        _known_dirs.add(d)
+
+
+def forget_known_dirs() -> None:
+    """删除过目录后调用，使之后的 ensure_dir 重新检查/创建目录"""
+    _known_dirs.clear()
+
+
+def _next_dup_target(dst_dir: Path, stem: str, suffix: str) -> Path:
+    """
+    返回 dst_dir 下第一个未被占用的 "{stem}_dup{n}{suffix}"
+
+    读取一次目录列表，而不是对 _dup1、_dup2…… 逐个 stat；
+    文件名按 casefold 比较，兼容大小写不敏感的文件系统。
+    """
+    prefix = f"{stem}_dup".casefold()
+    tail = suffix.casefold()
+    taken = set()
+    for name in os.listdir(dst_dir):
+        folded = name.casefold()
+        if folded.startswith(prefix) and folded.endswith(tail):
+            taken.add(folded[len(prefix):len(folded) - len(tail)])
+    
+    dedup = 1
+    while str(dedup) in taken:
+        dedup += 1
+    return dst_dir / f"{stem}_dup{dedup}{suffix}"
+
+
 def move_with_dedup(
     src: Path,
     dst_dir: Path,
@@ -25,7 +63,7 @@ def move_with_dedup(
     返回最终路径；若失败返回 None。
     """
     try:
-        dst_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(dst_dir)
         
         # 确定目标文件名
         if new_name:
@@ -33,27 +71,23 @@ def move_with_dedup(
         else:
             target = dst_dir / src.name
         
-        # 检查是否为原地移动
-        src_resolved = src.resolve()
-        target_resolved = target.resolve()
-        
-        if src_resolved == target_resolved:
+        # 检查是否为原地移动（路径字面相同则无需任何系统调用）
+        if target == src:
             return src
         
-        # 处理重名情况
-        if target.exists():
-            stem = target.stem
-            suffix = target.suffix
-            dedup = 1
-            while True:
-                candidate = dst_dir / f"{stem}_dup{dedup}{suffix}"
-                if not candidate.exists():
-                    target = candidate
-                    break
-                dedup += 1
+        # 处理重名情况（目标只 stat 一次，源文件仅在目标存在时才 stat）
+        try:
+            target_stat = os.stat(target)
+        except OSError:
+            target_stat = None
+        if target_stat is not None:
+            # 同一文件的另一种写法（相对路径、符号链接、大小写不敏感的文件系统）
+            if os.path.samestat(os.stat(src), target_stat):
+                return src
+            target = _next_dup_target(dst_dir, target.stem, target.suffix)
         
-        # 执行移动/重命名
-        src.rename(target)
+        # 执行移动/重命名（直接调用 os.rename，不经 pathlib 构造返回值）
+        os.rename(src, target)
         return target
 
     except Exception as e:
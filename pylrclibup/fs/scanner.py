@@ -0,0 +1,33 @@
+# ===== fs/scanner.py =====
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import AbstractSet, Iterator
+
+
+def iter_files(root: Path, suffixes: AbstractSet[str]) -> Iterator[Path]:
+    """
+    递归列出 root 下扩展名属于 suffixes 的文件（一次遍历，扩展名不区分大小写）
+
+    suffixes 为带点的小写扩展名（如 {".mp3", ".flac"}）。
+    基于 os.scandir：DirEntry 的类型信息来自目录读取本身，无需逐项 stat；
+    只为命中的文件构造 Path，不进入符号链接目录，无权限读取的目录被跳过。
+    顺序取决于文件系统，需要确定顺序时由调用方排序。
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    name = entry.name
+                    dot = name.rfind(".")
+                    if dot > 0 and name[dot:].lower() in suffixes and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
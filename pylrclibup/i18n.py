@@ -13,6 +13,9 @@ from typing import Optional, Callable
 # 全局翻译函数（类型注解）
 _translate: Callable[[str], str] = lambda x: x
 
+# 当前生效的语言代码（由 setup_i18n 设置）
+_current_locale: str = 'zh_CN'
+
 
 def setup_i18n(
     locale: Optional[str] = None,
@@ -25,7 +28,7 @@ def setup_i18n(
         locale: 语言代码（如 'en_US'、'zh_CN'），None 则自动检测
         localedir: 翻译文件目录，None 则使用默认位置
     """
-    global _translate
+    global _translate, _current_locale
     
     # 默认翻译文件位置
     if localedir is None:
@@ -35,6 +38,8 @@ def setup_i18n(
     if locale is None:
         locale = _detect_locale()
     
+    _current_locale = locale
+    
     # 只有中文环境才使用源码（中文）
     if locale.startswith('zh'):
         _translate = lambda x: x
@@ -91,6 +96,11 @@ def _detect_locale() -> str:
     return 'en_US'
 
 
+def get_locale() -> str:
+    """获取当前生效的语言代码"""
+    return _current_locale
+
+
 def get_text(message: str) -> str:
     """获取翻译后的文本"""
     return _translate(message)
@@ -14,6 +14,28 @@ from typing import Optional
 _logger: Optional[logging.Logger] = None
 
 
+class _BufferedStreamHandler(logging.StreamHandler):
+    """
+    不在每条记录后 flush 的 StreamHandler
+
+    标准 StreamHandler 每条日志都会 flush 一次；stdout 重定向到文件/管道时，
+    每条日志即一次 write 系统调用。这里交给流自身的缓冲，由 flush_logs()
+    在每首歌处理完后统一写出。input() 在显示提示前会 flush stdout，
+    交互提示之前的日志不会滞留在缓冲中；终端下 stdout 按行缓冲，行为不变。
+    """
+
+    def flush(self) -> None:
+        pass
+
+
+class _ErrorStreamHandler(logging.StreamHandler):
+    """输出 ERROR 前先写出缓冲中的 stdout 日志，保持两路输出的先后顺序"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        sys.stdout.flush()
+        super().emit(record)
+
+
 def get_logger() -> logging.Logger:
     """获取或创建全局 logger 实例"""
     global _logger
@@ -34,12 +56,12 @@ def _setup_logger(
     
     logger.setLevel(level)
     
-    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler = _BufferedStreamHandler(sys.stdout)
     stdout_handler.setLevel(logging.DEBUG)
     stdout_handler.addFilter(lambda record: record.levelno < logging.ERROR)
     stdout_handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
     
-    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler = _ErrorStreamHandler(sys.stderr)
     stderr_handler.setLevel(logging.ERROR)
     stderr_handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
     
@@ -55,6 +77,18 @@ def set_log_level(level: int) -> None:
     get_logger().setLevel(level)
 
 
+def flush_logs() -> None:
+    """写出缓冲中的日志（批量处理时每首歌结束后调用）"""
+    for handler in get_logger().handlers:
+        if isinstance(handler, logging.StreamHandler):
+            handler.stream.flush()
+
+
+def is_log_enabled(level: int) -> bool:
+    """判断某级别日志是否会输出（用于跳过昂贵的消息构造）"""
+    return get_logger().isEnabledFor(level)
+
+
 # -------------------- 便捷函数（调用方需自行翻译）--------------------
 
 
@@ -2,42 +2,47 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
 import re
 
 from ..config import AppConfig
+from ..fs import iter_files
 from ..model import TrackMeta
 from ..i18n import get_text as _
-from .parser import normalize_name
+from .parser import normalize_name, NORMALIZE_CACHE_SIZE
 
 
 # -------------------- 艺人拆分 & 匹配 --------------------
 
+# 艺人分隔符（作用于小写后的字符串，一次扫描完成拆分）：
+# - feat. / feat / featuring
+# - 两侧都不是空白的半角逗号（"A,B"；"Tyler, The Creator" 这类不拆）
+# - " x "、"×"，以及 & 和 / ; 、 ， ､
+_ARTIST_SEP_RE = re.compile(
+    r"\bfeat\.?\s+"
+    r"|\bfeaturing\b"
+    r"|(?<!\s),(?!\s)"
+    r"| x "
+    r"|[×&和/;、，､]"
+)
+
 
 def split_artists(s: str) -> List[str]:
     """
     将艺人字符串拆分成多个 artist
     """
-    s = s.lower()
-    
-    # 处理 feat/featuring
-    s = re.sub(r'\bfeat\.?\s+', '<<<SEP>>>', s)
-    s = re.sub(r'\bfeaturing\b', '<<<SEP>>>', s)
-    
-    # 拆分半角逗号
-    s = re.sub(r'(?<!\s),(?!\s)', '<<<SEP>>>', s)
-    
-    # 处理其他分隔符
-    for sep in [" x ", " X ", "×"]:
-        s = s.replace(sep, '<<<SEP>>>')
-    
-    for sep in ["&", "和", "/", ";", "、", "，", "､"]:
-        s = s.replace(sep, '<<<SEP>>>')
-    
-    artists = [a.strip() for a in s.split('<<<SEP>>>') if a.strip()]
+    return list(_split_artists_cached(s))
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _split_artists_cached(s: str) -> Tuple[str, ...]:
+    """split_artists 的缓存实现（返回不可变的 tuple，调用方拿到的是新列表）"""
+    parts = _ARTIST_SEP_RE.split(s.lower())
+    artists = [a.strip() for a in parts if a.strip()]
     
-    return list(dict.fromkeys(artists))
+    return tuple(dict.fromkeys(artists))
 
 
 def match_artists(mp3_artists: List[str], lrc_artists: List[str]) -> bool:
@@ -50,15 +55,73 @@ def match_artists(mp3_artists: List[str], lrc_artists: List[str]) -> bool:
 # -------------------- LRC 文件名解析 & 匹配 --------------------
 
 
-def parse_lrc_filename(path: Path) -> Tuple[List[str], str]:
-    """从 LRC 文件名解析出 (artists_list, title_norm)"""
-    stem = path.stem
+_LRC_SUFFIXES = frozenset({".lrc"})
+
+
+def iter_lrc_files(root: Path) -> Iterator[Path]:
+    """递归列出 root 下的 .lrc 文件（扩展名不区分大小写，不跟随符号链接目录）"""
+    return iter_files(root, _LRC_SUFFIXES)
+
+
+# LRC 索引：title_norm -> [(文件名中的原始艺人部分, 路径), ...]
+LrcIndex = Dict[str, List[Tuple[str, Path]]]
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _artist_set(artist_raw: str) -> FrozenSet[str]:
+    """艺人字符串 → 规范化后的艺人集合（按原始字符串缓存）"""
+    return frozenset(normalize_name(a) for a in split_artists(artist_raw))
+
+
+def build_lrc_index(lrc_dir: Path) -> LrcIndex:
+    """
+    遍历 lrc_dir 一次，按规范化标题为所有 "艺人 - 标题.lrc" 文件建立索引
+
+    批量处理时只需构建一次，之后每首歌按标题直接查找候选，
+    不必为每首歌重新遍历目录、解析全部文件名。
+    建索引时只规范化标题；艺人部分保持原样，
+    只有标题命中的候选才会拆分艺人。
+    """
+    index: LrcIndex = {}
+    for p in iter_lrc_files(lrc_dir):
+        entry = _index_entry(p)
+        if entry is not None:
+            index.setdefault(entry[0], []).append((entry[1], p))
+    return index
+
+
+def _index_entry(p: Path) -> Optional[Tuple[str, str]]:
+    """LRC 路径 → (title_norm, artist_raw)；文件名不是 "艺人 - 标题" 形式时返回 None"""
+    stem = p.stem
     if " - " not in stem:
-        return [], ""
+        return None
     artist_raw, title_raw = stem.split(" - ", 1)
-    artists = split_artists(artist_raw)
-    title = normalize_name(title_raw)
-    return artists, title
+    title_norm = normalize_name(title_raw)
+    if not title_norm:
+        return None
+    return title_norm, artist_raw
+
+
+def update_lrc_index(index: LrcIndex, lrc_dir: Path, old: Path, new: Optional[Path]) -> None:
+    """
+    LRC 被移动/重命名后就地更新索引
+
+    移除 old 对应的条目；new 仍位于 lrc_dir 下时按新文件名重新登记，
+    使批量处理中的后续曲目看到与重新遍历目录相同的结果。
+    """
+    entry = _index_entry(old)
+    if entry is not None:
+        bucket = index.get(entry[0])
+        if bucket:
+            bucket[:] = [item for item in bucket if item[1] != old]
+            if not bucket:
+                del index[entry[0]]
+
+    if new is None or new.suffix.lower() not in _LRC_SUFFIXES or not new.is_relative_to(lrc_dir):
+        return
+    entry = _index_entry(new)
+    if entry is not None:
+        index.setdefault(entry[0], []).append((entry[1], new))
 
 
 def find_lrc_for_track(
@@ -66,25 +129,30 @@ def find_lrc_for_track(
     config: AppConfig,
     *,
     interactive: bool = True,
+    index: Optional[LrcIndex] = None,
 ) -> Optional[Path]:
     """
     在 config.lrc_dir 下递归寻找和某首歌曲匹配的 LRC 文件
-    """
-    meta_title_norm = normalize_name(meta.track)
-    meta_artists = split_artists(meta.artist)
 
-    candidates: List[Path] = []
+    传入 index（build_lrc_index 的结果）时直接查索引，不再遍历目录；
+    索引构建后被移走的文件会被跳过。
+    """
+    shared_index = index is not None
+    if index is None:
+        index = build_lrc_index(config.lrc_dir)
 
-    for p in config.lrc_dir.rglob("*.lrc"):
-        lrc_artists, lrc_title_norm = parse_lrc_filename(p)
-        if not lrc_title_norm:
-            continue
+    bucket = index.get(normalize_name(meta.track))
+    if not bucket:
+        return None
 
-        if lrc_title_norm != meta_title_norm:
-            continue
+    meta_artists_norm = _artist_set(meta.artist)
 
-        if match_artists(meta_artists, lrc_artists):
-            candidates.append(p)
+    candidates: List[Path] = [
+        p
+        for artist_raw, p in bucket
+        if not _artist_set(artist_raw).isdisjoint(meta_artists_norm)
+        and (not shared_index or p.is_file())
+    ]
 
     if not candidates:
         return None
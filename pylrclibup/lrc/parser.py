@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import sys
 import unicodedata
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional
 
 from ..logging_utils import log_warn, log_error
 from ..i18n import get_text as _
@@ -14,51 +17,60 @@ from ..i18n import get_text as _
 
 # -------------------- 文本规范化 --------------------
 
+# 西里尔字母映射 + 全角标点替换（合并为一张 str.translate 表，导入时构建一次）
+_NAME_TABLE = str.maketrans({
+    # 西里尔字母
+    'ё': 'е',
+    'і': 'и',
+    'ї': 'и',
+    'є': 'е',
+    'ґ': 'г',
+    # 全角标点
+    "（": "(",
+    "）": ")",
+    "【": "[",
+    "】": "]",
+    "：": ":",
+    "。": ".",
+    "，": ",",
+    "！": "!",
+    "？": "?",
+    "＆": "&",
+    "／": "/",
+    "；": ";",
+})
 
+_WS_RE = re.compile(r"\s+")
+
+# 规范化结果缓存大小：同一艺人/标题会在整个曲库中反复出现
+NORMALIZE_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_name(s: str) -> str:
     """
-    增强版规范化：支持多语言
+    增强版规范化：支持多语言（纯函数，结果按输入缓存）
     """
     s = s.strip().lower()
     
-    # Unicode 规范化
-    s = unicodedata.normalize('NFKC', s)
-    
-    # 西里尔字母映射
-    cyrillic_map = {
-        'ё': 'е',
-        'і': 'и',
-        'ї': 'и',
-        'є': 'е',
-        'ґ': 'г',
-    }
-    for old, new in cyrillic_map.items():
-        s = s.replace(old, new)
-    
-    # 全角标点替换
-    replacements = {
-        "（": "(",
-        "）": ")",
-        "【": "[",
-        "】": "]",
-        "：": ":",
-        "。": ".",
-        "，": ",",
-        "！": "!",
-        "？": "?",
-        "＆": "&",
-        "／": "/",
-        "；": ";",
-    }
-    for k, v in replacements.items():
-        s = s.replace(k, v)
+    # 纯 ASCII 时 NFKC 与映射表均不起作用，直接跳过
+    if not s.isascii():
+        # Unicode 规范化
+        s = unicodedata.normalize('NFKC', s)
+        
+        # 西里尔字母映射 & 全角标点替换
+        s = s.translate(_NAME_TABLE)
     
     # 移除零宽字符和控制字符（保留空格）
-    s = ''.join(ch for ch in s if unicodedata.category(ch)[0] not in ('C', 'Z') or ch == ' ')
+    # Unicode 类别 C*/Z* 中除空格外的字符恰好就是 str.isprintable() 判定的不可打印字符，
+    # 大多数名称整体可打印，无需逐字符扫描
+    if not s.isprintable():
+        s = ''.join(ch for ch in s if ch.isprintable())
     
     # 合并多余空格
-    s = re.sub(r"\s+", " ", s)
-    return s.strip()
+    s = _WS_RE.sub(" ", s)
+    # 驻留：不同写法规范化后的同一名称共享同一对象，集合比较可走指针相等的快路径
+    return sys.intern(s.strip())
 
 
 # -------------------- LRC 内容解析 --------------------
@@ -67,10 +79,24 @@ def normalize_name(s: str) -> str:
 TIMESTAMP_RE = re.compile(r"\[\d{2}:\d{2}\.\d{2,3}\]")
 
 # 扩展时间标签
-EXTENDED_TIMESTAMP_RE = re.compile(r"\[\d{2}:\d{2}(?:\.\d{1,3}(?:-\d{1,3})?)?\]")
+# 分组：1 = 小数部分，2 = "-xxx" 扩展部分；据此可判断是否同时是标准时间标签
+EXTENDED_TIMESTAMP_RE = re.compile(r"\[\d{2}:\d{2}(?:\.(\d{1,3})(-\d{1,3})?)?\]")
+
+
+def _is_header_tag(s: str) -> bool:
+    """
+    判断是否为 LRC 头部标签（s 为不含换行的单行）
+
+    "[" + 2~3 个 ASCII 字母 + ":" + 至少一个字符 + "]"，只用 str 方法，不进正则引擎。
+    """
+    if len(s) < 6 or s[0] != "[" or s[-1] != "]":
+        return False
+    colon = s.find(":")
+    if colon not in (3, 4) or len(s) < colon + 3:
+        return False
+    key = s[1:colon]
+    return key.isascii() and key.isalpha()
 
-# LRC 头部标签
-HEADER_TAG_RE = re.compile(r"^\[[a-zA-Z]{2,3}:.+\]$")
 
 # NCM 常见 credit 关键字
 CREDIT_KEYWORDS = (
@@ -93,8 +119,10 @@ PURE_MUSIC_PHRASES = (
     "instrumental",
 )
 
+_PURE_MUSIC_RE = re.compile("|".join(re.escape(p) for p in PURE_MUSIC_PHRASES))
+
 
-@dataclass
+@dataclass(slots=True)
 class ParsedLRC:
     """
     LRC 解析结果：
@@ -110,18 +138,31 @@ class ParsedLRC:
 def read_text_any(path: Path) -> str:
     """
     尝试多种编码读取文本文件
+
+    文件只读取一次，再依次尝试解码（utf-8-sig 同样能解码不带 BOM 的 UTF-8）。
+    不做换行转换，由调用方统一处理 \r\n / \r。
     """
-    for enc in ("utf-8-sig", "utf-8", "gb18030"):
+    data = path.read_bytes()
+    for enc in ("utf-8-sig", "gb18030"):
         try:
-            return path.read_text(encoding=enc)
+            return data.decode(enc)
         except UnicodeDecodeError:
             continue
-    return path.read_text(encoding="utf-8", errors="ignore")
+    return data.decode("utf-8", errors="ignore")
+
+
+_CJK_RE = re.compile(r'[\u3040-\u309F\u30A0-\u30FF\u3400-\u4DBF\u4E00-\u9FFF]')
 
 
 def _contains_cjk(text: str) -> bool:
     """粗略判断文本是否包含中日韩文字"""
-    return bool(re.search(r'[\u3040-\u309F\u30A0-\u30FF\u3400-\u4DBF\u4E00-\u9FFF]', text))
+    return _CJK_RE.search(text) is not None
+
+
+def _is_standard_timestamp(m: re.Match) -> bool:
+    """EXTENDED_TIMESTAMP_RE 的匹配结果是否同时满足 TIMESTAMP_RE（[mm:ss.xx] / [mm:ss.xxx]）"""
+    fraction = m.group(1)
+    return fraction is not None and len(fraction) >= 2 and m.group(2) is None
 
 
 def parse_lrc_file(path: Path, *, remove_translations: bool = True) -> ParsedLRC:
@@ -156,12 +197,22 @@ def parse_lrc_file(path: Path, *, remove_translations: bool = True) -> ParsedLRC
     started = False
     prev_timestamp: Optional[str] = None
     
+    # 循环内频繁使用的绑定方法缓存为局部变量
+    match_extended = EXTENDED_TIMESTAMP_RE.match
+    match_credit = CREDIT_RE.match
+    search_pure_music = _PURE_MUSIC_RE.search
+    
     for line in raw.splitlines():
         s = line.strip()
         
-        # 阶段 1: 删除歌词头
+        # 不以 "[" 开头的行既不是时间标签也不是头部标签，无需正则匹配；
+        # 以 "[" 开头的行只做一次时间标签匹配
+        tagged = s[:1] == "["
+        timestamp_match = match_extended(s) if tagged else None
+        
+        # 阶段 1: 删除歌词头（直到第一个标准时间标签）
         if not started:
-            if TIMESTAMP_RE.match(s):
+            if timestamp_match is not None and _is_standard_timestamp(timestamp_match):
                 started = True
             else:
                 continue
@@ -175,27 +226,25 @@ def parse_lrc_file(path: Path, *, remove_translations: bool = True) -> ParsedLRC
             prev_timestamp = None
             continue
         
-        # LRC 头部标签
-        if HEADER_TAG_RE.match(s):
+        # LRC 头部标签（与时间标签互斥）
+        if timestamp_match is None and tagged and _is_header_tag(s):
             synced_lines.append(line)
             prev_timestamp = None
             continue
         
-        # 提取时间戳和歌词文本
-        timestamp_match = EXTENDED_TIMESTAMP_RE.match(s)
-        
         if timestamp_match:
             current_timestamp = timestamp_match.group(0)
             text_no_tag = s[len(current_timestamp):].strip()
             
             # 检测"纯音乐，请欣赏"
-            if text_no_tag and any(p in text_no_tag for p in PURE_MUSIC_PHRASES):
+            if text_no_tag and search_pure_music(text_no_tag):
                 is_instrumental = True
                 prev_timestamp = None
                 continue
             
             # 检测 credit 信息
-            if text_no_tag and CREDIT_RE.match(text_no_tag):
+            # （CREDIT_RE 必须以关键字开头，先用 C 实现的 startswith 筛掉绝大多数歌词行）
+            if text_no_tag.startswith(CREDIT_KEYWORDS) and match_credit(text_no_tag):
                 prev_timestamp = None
                 continue
             
@@ -231,6 +280,28 @@ def parse_lrc_file(path: Path, *, remove_translations: bool = True) -> ParsedLRC
     )
 
 
+def parse_many(
+    paths: Iterable[Path],
+    *,
+    remove_translations: bool = True,
+    max_workers: int = 8,
+) -> List[ParsedLRC]:
+    """
+    并发解析多个 LRC 文件（线程池，读文件的 I/O 可相互重叠）
+
+    结果顺序与 paths 一致；单个文件失败时与 parse_lrc_file 相同，得到空的 ParsedLRC。
+    """
+    paths = list(paths)
+    if len(paths) <= 1 or max_workers <= 1:
+        return [parse_lrc_file(p, remove_translations=remove_translations) for p in paths]
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(executor.map(
+            lambda p: parse_lrc_file(p, remove_translations=remove_translations),
+            paths,
+        ))
+
+
 def write_lrc_file(path: Path, content: str) -> bool:
     """
     将标准化后的 LRC 内容写回文件（使用 UTF-8 编码）
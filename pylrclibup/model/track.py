@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -45,6 +46,27 @@ TAG_MAPPINGS: Dict[str, Dict[str, list[str]]] = {
     },
 }
 
+# ID3v1 标签固定位于文件末尾 128 字节
+ID3V1_SIZE = 128
+
+
+def _has_id3_tag(path: Path) -> bool:
+    """
+    只读文件头/尾几个字节，判断 MP3 是否带有 ID3 标签
+
+    ID3v2 以 b"ID3" 开头；ID3v1 位于文件最后 128 字节、以 b"TAG" 开头
+    （mutagen 在没有 ID3v2 时会读取 ID3v1）。
+    """
+    with open(path, "rb") as f:
+        if f.read(3) == b"ID3":
+            return True
+        try:
+            f.seek(-ID3V1_SIZE, os.SEEK_END)
+        except OSError:
+            # 文件不足 128 字节
+            return False
+        return f.read(3) == b"TAG"
+
 
 @dataclass
 class TrackMeta:
@@ -116,6 +138,10 @@ class TrackMeta:
         ext = audio_path.suffix.lower().strip(".")
         
         try:
+            # 无标签的 MP3 无需交给 mutagen 解析整个文件头
+            if ext == "mp3" and not _has_id3_tag(audio_path):
+                log_warn(_("音频文件无标签：{filename}").format(filename=audio_path.name))
+                return None
             audio = MutaFile(audio_path)
             if audio is None:
                 log_warn(_("无法读取音频文件：{filename}").format(filename=audio_path.name))
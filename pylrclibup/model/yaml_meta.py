@@ -8,13 +8,11 @@ from typing import Optional
 
 import yaml
 
+from ..config import SUPPORTED_YAML_EXTENSIONS
 from ..logging_utils import log_warn, log_error
 from ..i18n import get_text as _
 
 
-SUPPORTED_YAML_EXTENSIONS = {".yaml", ".yml"}
-
-
 @dataclass
 class YamlTrackMeta:
     """
@@ -2,36 +2,76 @@
 
 from __future__ import annotations
 
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Callable, List, Optional, Set, Tuple, TypeVar, Union
 
-from ..config import AppConfig, SUPPORTED_AUDIO_EXTENSIONS
-from ..model import TrackMeta, LyricsRecord, YamlTrackMeta, SUPPORTED_YAML_EXTENSIONS
-from ..lrc import find_lrc_for_track, parse_lrc_file, cleanse_lrc_file, ParsedLRC
+from ..config import AppConfig, SUPPORTED_AUDIO_EXTENSIONS, SUPPORTED_YAML_EXTENSIONS
+from ..model import TrackMeta, LyricsRecord, YamlTrackMeta
+from ..lrc import find_lrc_for_track, build_lrc_index, update_lrc_index, LrcIndex, parse_lrc_file, cleanse_lrc_file, ParsedLRC
 from ..lrc.yaml_matcher import find_lrc_for_yaml_meta
-from ..api import ApiClient, upload_lyrics, upload_instrumental
-from ..fs import move_with_dedup, cleanup_empty_dirs
-from ..logging_utils import log_info, log_warn, log_error
+from ..api import ApiClient
+from ..fs import move_with_dedup, cleanup_empty_dirs, iter_files
+from ..logging_utils import log_info, log_warn, log_error, flush_logs
 from ..i18n import get_text as _
 
+MetaT = TypeVar("MetaT", TrackMeta, YamlTrackMeta)
+
+# 扫描 tracks_dir 时收集的全部扩展名
+_SCAN_EXTENSIONS = SUPPORTED_AUDIO_EXTENSIONS | SUPPORTED_YAML_EXTENSIONS
+
+# 确认提示中视为"是"的输入（已 strip().lower()）；其余输入（含直接回车）均视为"否"
+_YES = frozenset({"y", "yes", "是"})
+
+# 手动输入路径时会被去掉的成对引号
+_QUOTES = "'\""
+
 
 # -------------------- 预览辅助函数 --------------------
 
 
+# str.splitlines() 认作换行、而 "\n" 计数无法正确处理的字符
+_OTHER_LINE_BREAKS_RE = re.compile("[\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def _head_and_count(text: str, n: int) -> Tuple[List[str], int]:
+    """
+    返回 text 的前 n 行与总行数，结果与 text.splitlines() 一致
+
+    只按 "\n" 分隔的文本（绝大多数歌词）只切出前 n 行，总行数用 str.count 统计，
+    不为其余各行分配字符串；含其他换行符时退回 splitlines()。
+    """
+    if _OTHER_LINE_BREAKS_RE.search(text):
+        lines = text.splitlines()
+        return lines[:n], len(lines)
+    count = text.count("\n") + (0 if text.endswith("\n") else 1)
+    return text.split("\n", n)[:min(n, count)], count
+
+
 def _preview(label: str, text: str, max_lines: int) -> None:
-    """预览歌词内容"""
-    print(f"--- {label} ---")
-    if not text:
-        print(_("[空]"))
-        print("-" * 40)
+    """预览歌词内容（拼成一个字符串后一次写出）；max_lines <= 0 时不预览"""
+    if max_lines <= 0:
         return
-    lines = text.splitlines()
-    for ln in lines[:max_lines]:
-        print(ln)
-    if len(lines) > max_lines:
-        print(_("... 共 {count} 行").format(count=len(lines)))
-    print("-" * 40)
+    buf = [f"--- {label} ---\n"]
+    if not text:
+        buf.append(_("[空]") + "\n")
+    else:
+        head, count = _head_and_count(text, max_lines)
+        buf.extend(ln + "\n" for ln in head)
+        if count > max_lines:
+            buf.append(_("... 共 {count} 行").format(count=count) + "\n")
+    buf.append("-" * 40 + "\n")
+    sys.stdout.write("".join(buf))
+
+
+# -------------------- 交互辅助函数 --------------------
+
+
+def _confirm(prompt: str) -> bool:
+    """询问 [y/N] 问题，只有明确回答"是"时返回 True"""
+    return input(prompt).strip().lower() in _YES
 
 
 # -------------------- LRC 查找统一入口 --------------------
@@ -42,6 +82,7 @@ def _find_lrc_for_meta(
     config: AppConfig,
     *,
     interactive: bool = True,
+    lrc_index: Optional[LrcIndex] = None,
 ) -> Optional[Path]:
     """
     统一的 LRC 查找入口
@@ -49,6 +90,8 @@ def _find_lrc_for_meta(
     根据 meta 类型选择不同的查找策略：
     - YamlTrackMeta: 优先使用指定的 lrc_file，其次同名文件，最后降级到通用匹配
     - TrackMeta: 使用原有的匹配逻辑
+
+    lrc_index 为批量处理时预先构建的 LRC 索引（None 则现场遍历 lrc_dir）。
     """
     if isinstance(meta, YamlTrackMeta):
         # YAML 元数据：优先使用指定的 lrc_file，其次同名文件
@@ -57,33 +100,54 @@ def _find_lrc_for_meta(
             return lrc
         # 降级到通用匹配（需要转换为 TrackMeta）
         track_meta = TrackMeta.from_yaml(meta)
-        return find_lrc_for_track(track_meta, config, interactive=interactive)
+        return find_lrc_for_track(track_meta, config, interactive=interactive, index=lrc_index)
     else:
         # 音频文件元数据：使用原有匹配逻辑
-        return find_lrc_for_track(meta, config, interactive=interactive)
+        return find_lrc_for_track(meta, config, interactive=interactive, index=lrc_index)
 
 
 # -------------------- 文件移动逻辑 --------------------
 
 
+def _cleanup_later(root: Path, cleanup_dirs: Optional[Set[Path]]) -> None:
+    """清理 root 下的空目录；批量处理时（cleanup_dirs 不为 None）只做记录"""
+    if cleanup_dirs is None:
+        cleanup_empty_dirs(root)
+    else:
+        cleanup_dirs.add(root)
+
+
 def move_files_after_processing(
     config: AppConfig,
     meta: Union[TrackMeta, YamlTrackMeta],
     lrc_path: Optional[Path],
+    *,
+    lrc_index: Optional[LrcIndex] = None,
+    cleanup_dirs: Optional[Set[Path]] = None,
 ) -> None:
     """
     处理完成后移动文件的统一逻辑
     
-    注意：YAML 元数据文件本身不移动，只移动 LRC
+    注意：YAML 元数据文件本身不移动，只移动 LRC；
+    传入 lrc_index 时，LRC 移动后同步更新索引；
+    只有确实移走了文件的根目录才需要清理空目录；传入 cleanup_dirs 时不立即清理，
+    只把这些根目录记入该集合，由调用方在批量处理结束后统一清理
     """
     is_yaml = isinstance(meta, YamlTrackMeta)
+    done_tracks_dir = config.done_tracks_dir
+    done_lrc_dir = config.done_lrc_dir
+    tracks_dir = config.tracks_dir
+    lrc_dir = config.lrc_dir
     
     # 步骤 1：移动音频文件（YAML 模式跳过）
     new_audio_path = meta.path
     
-    if not is_yaml and config.done_tracks_dir:
-        moved_audio = move_with_dedup(meta.path, config.done_tracks_dir)
+    if not is_yaml and done_tracks_dir:
+        moved_audio = move_with_dedup(new_audio_path, done_tracks_dir)
         if moved_audio:
+            # 已在目标目录时 move_with_dedup 原样返回源路径，并未移动
+            if moved_audio != new_audio_path:
+                _cleanup_later(tracks_dir, cleanup_dirs)
             new_audio_path = moved_audio
             log_info(_("音频文件已移动到：{path}").format(path=new_audio_path))
         else:
@@ -91,17 +155,19 @@ def move_files_after_processing(
     
     # 如果没有 LRC 文件，直接返回
     if not lrc_path or not lrc_path.exists():
-        if not is_yaml:
-            cleanup_empty_dirs(config.tracks_dir)
         return
     
+    # pathlib 的 parent/stem 每次访问都会重新计算，这里只取一次
+    lrc_parent = lrc_path.parent
+    lrc_stem = lrc_path.stem
+    
     # 步骤 2：确定 LRC 的目标目录
-    if config.done_lrc_dir:
-        lrc_target_dir = config.done_lrc_dir
+    if done_lrc_dir:
+        lrc_target_dir = done_lrc_dir
     elif config.follow_mp3 and not is_yaml:
         lrc_target_dir = new_audio_path.parent
     else:
-        lrc_target_dir = lrc_path.parent
+        lrc_target_dir = lrc_parent
     
     # 步骤 3：确定 LRC 的目标文件名
     new_lrc_name = None
@@ -109,29 +175,26 @@ def move_files_after_processing(
         new_lrc_name = new_audio_path.stem
     
     # 步骤 4：判断是否需要移动
-    needs_move = (
-        lrc_target_dir != lrc_path.parent or 
-        (new_lrc_name and new_lrc_name != lrc_path.stem)
-    )
+    changes_dir = lrc_target_dir != lrc_parent
+    changes_name = bool(new_lrc_name) and new_lrc_name != lrc_stem
     
-    if needs_move:
+    if changes_dir or changes_name:
         new_lrc_path = move_with_dedup(lrc_path, lrc_target_dir, new_name=new_lrc_name)
         if new_lrc_path:
+            if new_lrc_path != lrc_path:
+                _cleanup_later(lrc_dir, cleanup_dirs)
+            if lrc_index is not None:
+                update_lrc_index(lrc_index, lrc_dir, lrc_path, new_lrc_path)
             action = []
-            if lrc_target_dir != lrc_path.parent:
+            if changes_dir:
                 action.append(_("移动到 {dir}").format(dir=lrc_target_dir))
-            if new_lrc_name and new_lrc_name != lrc_path.stem:
+            if changes_name:
                 action.append(_("重命名为 {name}").format(name=new_lrc_path.name))
             log_info(_("LRC 已{action}").format(action=_("、").join(action)))
         else:
             log_warn(_("LRC 移动失败"))
     else:
         log_info(_("LRC 保持原地不动"))
-    
-    # 步骤 5：清理空目录
-    if not is_yaml:
-        cleanup_empty_dirs(config.tracks_dir)
-    cleanup_empty_dirs(config.lrc_dir)
 
 
 # -------------------- 单曲处理辅助函数 --------------------
@@ -142,23 +205,29 @@ def _handle_cached_lyrics(
     meta: TrackMeta,
     cached: LyricsRecord,
     original_meta: Optional[Union[TrackMeta, YamlTrackMeta]] = None,
+    lrc_index: Optional[LrcIndex] = None,
+    cleanup_dirs: Optional[Set[Path]] = None,
 ) -> None:
     """处理内部数据库已有歌词的情况"""
+    preview_lines = config.preview_lines
     log_info(_("内部数据库已存在歌词 → 自动移动音频文件+LRC 并跳过上传（不再重复提交）"))
-    _preview(_("已有 plainLyrics"), cached.plain, config.preview_lines)
-    _preview(_("已有 syncedLyrics"), cached.synced, config.preview_lines)
+    _preview(_("已有 plainLyrics"), cached.plain, preview_lines)
+    _preview(_("已有 syncedLyrics"), cached.synced, preview_lines)
     
     # 使用原始 meta 查找 LRC（保留 YAML 的 lrc_file 信息）
     source_meta = original_meta if original_meta else meta
-    lrc_path = _find_lrc_for_meta(source_meta, config, interactive=True)
-    move_files_after_processing(config, source_meta, lrc_path)
+    lrc_path = _find_lrc_for_meta(source_meta, config, interactive=True, lrc_index=lrc_index)
+    move_files_after_processing(config, source_meta, lrc_path, lrc_index=lrc_index, cleanup_dirs=cleanup_dirs)
 
 
 def _handle_external_lyrics(
     config: AppConfig,
+    api_client: ApiClient,
     meta: TrackMeta,
     external: LyricsRecord,
     original_meta: Optional[Union[TrackMeta, YamlTrackMeta]] = None,
+    lrc_index: Optional[LrcIndex] = None,
+    cleanup_dirs: Optional[Set[Path]] = None,
 ) -> bool:
     """
     处理外部抓取到歌词的情况
@@ -169,35 +238,33 @@ def _handle_external_lyrics(
     plain_ext = external.plain
     synced_ext = external.synced
     instrumental_ext = external.instrumental
+    preview_lines = config.preview_lines
     
     log_info(_("外部抓取到歌词（仅供参考，可选择是否直接使用外部版本上传）："))
-    _preview(_("外部 plainLyrics"), plain_ext, config.preview_lines)
-    _preview(_("外部 syncedLyrics"), synced_ext, config.preview_lines)
+    _preview(_("外部 plainLyrics"), plain_ext, preview_lines)
+    _preview(_("外部 syncedLyrics"), synced_ext, preview_lines)
     
     if instrumental_ext:
         log_info(_("外部记录中该曲被标记为 instrumental（或两种歌词字段均为空）。"))
     
     # 始终询问用户
-    choice = input(_("是否直接使用外部版本上传？[y/N]: ")).strip().lower()
-    use_ext = choice in ("y", "yes")
-    
-    if not use_ext:
+    if not _confirm(_("是否直接使用外部版本上传？[y/N]: ")):
         log_info(_("用户选择不直接使用外部歌词 → 继续尝试本地 LRC。"))
         return False
     
     # 执行上传
     if instrumental_ext:
         log_info(_("将使用“纯音乐”方式上传（不包含任何歌词内容，只标记为 instrumental）。"))
-        ok = upload_instrumental(config, meta)
+        ok = api_client.upload_instrumental(meta)
     else:
         log_info(_("将直接使用外部 plain+synced 歌词上传。"))
-        ok = upload_lyrics(config, meta, plain_ext, synced_ext)
+        ok = api_client.upload_lyrics(meta, plain_ext, synced_ext)
     
     if ok:
         log_info(_("外部歌词上传完成 ✓"))
         source_meta = original_meta if original_meta else meta
-        lrc_path = _find_lrc_for_meta(source_meta, config, interactive=True)
-        move_files_after_processing(config, source_meta, lrc_path)
+        lrc_path = _find_lrc_for_meta(source_meta, config, interactive=True, lrc_index=lrc_index)
+        move_files_after_processing(config, source_meta, lrc_path, lrc_index=lrc_index, cleanup_dirs=cleanup_dirs)
     else:
         log_error(_("外部歌词上传失败 ×"))
     
@@ -206,7 +273,10 @@ def _handle_external_lyrics(
 
 def _prompt_for_missing_lrc(
     config: AppConfig,
+    api_client: ApiClient,
     meta: TrackMeta,
+    *,
+    cleanup_dirs: Optional[Set[Path]] = None,
 ) -> Optional[Path]:
     """
     当未找到本地 LRC 时，提示用户选择操作
@@ -231,10 +301,10 @@ def _prompt_for_missing_lrc(
         
         elif choice == "i":
             log_info(_("将上传空歌词（标记为纯音乐）。"))
-            ok = upload_instrumental(config, meta)
+            ok = api_client.upload_instrumental(meta)
             if ok:
                 log_info(_("纯音乐标记上传完成 ✓"))
-                move_files_after_processing(config, meta, lrc_path=None)
+                move_files_after_processing(config, meta, lrc_path=None, cleanup_dirs=cleanup_dirs)
             else:
                 log_error(_("纯音乐标记上传失败 ×"))
             return None
@@ -256,25 +326,21 @@ def _get_manual_lrc_path() -> Optional[Path]:
         return None
     
     # 处理引号（单引号/双引号）
-    if (manual_path_raw.startswith("'") and manual_path_raw.endswith("'")) or \
-       (manual_path_raw.startswith('"') and manual_path_raw.endswith('"')):
+    if len(manual_path_raw) >= 2 and manual_path_raw[0] == manual_path_raw[-1] and manual_path_raw[0] in _QUOTES:
         manual_path_raw = manual_path_raw[1:-1]
     
-    # 处理路径：支持绝对路径和相对路径
+    # 处理路径：支持绝对路径和相对路径（相对路径按当前工作目录解析）
     lrc_path = Path(manual_path_raw).expanduser()
     
-    if not lrc_path.is_absolute():
-        lrc_path = Path.cwd() / lrc_path
+    if not lrc_path.is_file():
+        print(_("文件不存在或不是有效文件：{path}").format(path=lrc_path.absolute()))
+        return None
     
+    # 确认文件存在后再解析符号链接与 ".."（resolve 需要逐级查询路径）
     lrc_path = lrc_path.resolve()
     
-    if not lrc_path.exists() or not lrc_path.is_file():
-        print(_("文件不存在或不是有效文件：{path}").format(path=lrc_path))
-        return None
-    
     if lrc_path.suffix.lower() != ".lrc":
-        confirm = input(_("警告：文件扩展名不是 .lrc，是否继续？[y/N]: ")).strip().lower()
-        if confirm not in ("y", "yes"):
+        if not _confirm(_("警告：文件扩展名不是 .lrc，是否继续？[y/N]: ")):
             return None
     
     log_info(_("使用手动指定的歌词文件：{path}").format(path=lrc_path))
@@ -283,10 +349,13 @@ def _get_manual_lrc_path() -> Optional[Path]:
 
 def _upload_local_lyrics(
     config: AppConfig,
+    api_client: ApiClient,
     meta: TrackMeta,
     lrc_path: Path,
     parsed: ParsedLRC,
     original_meta: Optional[Union[TrackMeta, YamlTrackMeta]] = None,
+    lrc_index: Optional[LrcIndex] = None,
+    cleanup_dirs: Optional[Set[Path]] = None,
 ) -> None:
     """上传本地解析的歌词"""
     treat_as_instrumental = parsed.is_instrumental or (
@@ -297,29 +366,27 @@ def _upload_local_lyrics(
     
     if treat_as_instrumental:
         log_info(_("根据解析结果：将按纯音乐曲目上传。"))
-        choice = input(_("确认以纯音乐方式上传？[y/N]: ")).strip().lower()
-        if choice not in ("y", "yes"):
+        if not _confirm(_("确认以纯音乐方式上传？[y/N]: ")):
             log_info(_("用户取消上传。"))
             return
         
-        ok = upload_instrumental(config, meta)
+        ok = api_client.upload_instrumental(meta)
         if ok:
             log_info(_("纯音乐上传完成 ✓"))
-            move_files_after_processing(config, source_meta, lrc_path)
+            move_files_after_processing(config, source_meta, lrc_path, lrc_index=lrc_index, cleanup_dirs=cleanup_dirs)
         else:
             log_error(_("纯音乐上传失败 ×"))
         return
     
     # 非纯音乐 → 正常上传 plain+synced
-    choice = input(_("确认上传本地歌词？[y/N]: ")).strip().lower()
-    if choice not in ("y", "yes"):
+    if not _confirm(_("确认上传本地歌词？[y/N]: ")):
         log_info(_("用户取消上传。"))
         return
     
-    ok = upload_lyrics(config, meta, parsed.plain, parsed.synced)
+    ok = api_client.upload_lyrics(meta, parsed.plain, parsed.synced)
     if ok:
         log_info(_("上传完成 ✓"))
-        move_files_after_processing(config, source_meta, lrc_path)
+        move_files_after_processing(config, source_meta, lrc_path, lrc_index=lrc_index, cleanup_dirs=cleanup_dirs)
     else:
         log_error(_("上传失败 ×"))
 
@@ -331,6 +398,9 @@ def process_track(
     config: AppConfig,
     api_client: ApiClient,
     meta: Union[TrackMeta, YamlTrackMeta],
+    *,
+    lrc_index: Optional[LrcIndex] = None,
+    cleanup_dirs: Optional[Set[Path]] = None,
 ) -> None:
     """
     处理一首歌（支持音频文件元数据或 YAML 元数据）：
@@ -341,6 +411,9 @@ def process_track(
       5. LRC 解析
       6. 上传（歌词 / 纯音乐）
       7. 移动文件 & 清理空目录
+
+    批量处理时传入 lrc_index 与 cleanup_dirs：共用 LRC 索引，
+    空目录由 process_all 在结束时统一清理。
     """
     is_yaml = isinstance(meta, YamlTrackMeta)
     source_type = "YAML" if is_yaml else _("音频")
@@ -350,25 +423,28 @@ def process_track(
     # 转换为 TrackMeta 用于 API 调用
     track_meta = TrackMeta.from_yaml(meta) if is_yaml else meta
 
-    # 1. 先查内部数据库（不触发外部抓取）
-    cached: Optional[LyricsRecord] = api_client.get_cached(track_meta)
-    if cached:
-        _handle_cached_lyrics(config, track_meta, cached, original_meta=meta)
+    # 1. 先查内部数据库，未命中时再查外部抓取（仅供参考，可选是否直接使用）
+    record, is_external = api_client.lookup(track_meta)
+    if record and not is_external:
+        _handle_cached_lyrics(
+            config, track_meta, record, original_meta=meta, lrc_index=lrc_index, cleanup_dirs=cleanup_dirs
+        )
         return
 
-    # 2. 再查外部抓取（仅供参考，可选是否直接使用）
-    external: Optional[LyricsRecord] = api_client.get_external(track_meta)
-    if external:
-        handled = _handle_external_lyrics(config, track_meta, external, original_meta=meta)
+    # 2. 外部抓取到的歌词
+    if record:
+        handled = _handle_external_lyrics(
+            config, api_client, track_meta, record, original_meta=meta, lrc_index=lrc_index, cleanup_dirs=cleanup_dirs
+        )
         if handled:
             return
 
     # 3. 查找本地 LRC 文件
-    lrc_path = _find_lrc_for_meta(meta, config, interactive=True)
+    lrc_path = _find_lrc_for_meta(meta, config, interactive=True, lrc_index=lrc_index)
     
     if not lrc_path:
         log_warn(_("⚠ 未找到本地 LRC 文件：{track}").format(track=meta.track))
-        lrc_path = _prompt_for_missing_lrc(config, track_meta)
+        lrc_path = _prompt_for_missing_lrc(config, api_client, track_meta, cleanup_dirs=cleanup_dirs)
         if not lrc_path:
             return
     
@@ -386,16 +462,40 @@ def process_track(
     if parsed.is_instrumental:
         log_info(_("LRC 中检测到“纯音乐，请欣赏”等字样，将按纯音乐处理（不上传歌词内容）。"))
 
-    _preview(_("本地 plainLyrics（将上传）"), parsed.plain, config.preview_lines)
-    _preview(_("本地 syncedLyrics（将上传）"), parsed.synced, config.preview_lines)
+    preview_lines = config.preview_lines
+    _preview(_("本地 plainLyrics（将上传）"), parsed.plain, preview_lines)
+    _preview(_("本地 syncedLyrics（将上传）"), parsed.synced, preview_lines)
 
     # 6. 上传歌词
-    _upload_local_lyrics(config, track_meta, lrc_path, parsed, original_meta=meta)
+    _upload_local_lyrics(
+        config, api_client, track_meta, lrc_path, parsed, original_meta=meta, lrc_index=lrc_index, cleanup_dirs=cleanup_dirs
+    )
 
 
 # -------------------- 批量处理 --------------------
 
 
+def _load_metas(
+    loader: Callable[[Path], Optional[MetaT]],
+    paths: List[Path],
+    max_workers: int,
+) -> List[MetaT]:
+    """
+    并发读取元数据（读取标签以 I/O 为主，线程池可让各文件的读取相互重叠）
+
+    结果保持 paths 的顺序，读取失败（返回 None）的文件被跳过。
+    """
+    if len(paths) <= 1 or max_workers <= 1:
+        results = [loader(p) for p in paths]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(paths)),
+            thread_name_prefix="pylrclibup-scan",
+        ) as executor:
+            results = list(executor.map(loader, paths))
+    return [m for m in results if m is not None]
+
+
 def process_all(config: AppConfig) -> None:
     """
     入口函数：递归扫描 tracks_dir 下所有支持的文件
@@ -406,36 +506,35 @@ def process_all(config: AppConfig) -> None:
 
     CLI 层只需要调用这一层。
     """
-    api_client = ApiClient(config)
-
     metas: List[Union[TrackMeta, YamlTrackMeta]] = []
     
+    # 一次遍历 tracks_dir，同时收集音频与 YAML 文件
+    audio_paths: List[Path] = []
+    yaml_paths: List[Path] = []
+    for p in iter_files(config.tracks_dir, _SCAN_EXTENSIONS):
+        if p.suffix.lower() in SUPPORTED_YAML_EXTENSIONS:
+            yaml_paths.append(p)
+        else:
+            audio_paths.append(p)
+    audio_paths.sort()
+    yaml_paths.sort()
+    
     # 扫描所有支持的音频格式
     audio_extensions_str = ", ".join(sorted(SUPPORTED_AUDIO_EXTENSIONS))
     log_info(_("扫描音频文件：{extensions}").format(extensions=audio_extensions_str))
     
-    for ext in SUPPORTED_AUDIO_EXTENSIONS:
-        pattern = f"*{ext}"
-        for p in sorted(config.tracks_dir.rglob(pattern)):
-            tm = TrackMeta.from_audio_file(p)
-            if tm:
-                metas.append(tm)
+    metas.extend(_load_metas(TrackMeta.from_audio_file, audio_paths, config.max_workers))
     
     # 扫描所有支持的 YAML 格式
     yaml_extensions_str = ", ".join(sorted(SUPPORTED_YAML_EXTENSIONS))
     log_info(_("扫描 YAML 元数据文件：{extensions}").format(extensions=yaml_extensions_str))
     
-    for ext in SUPPORTED_YAML_EXTENSIONS:
-        pattern = f"*{ext}"
-        for p in sorted(config.tracks_dir.rglob(pattern)):
-            ym = YamlTrackMeta.from_yaml_file(p)
-            if ym:
-                metas.append(ym)
+    metas.extend(_load_metas(YamlTrackMeta.from_yaml_file, yaml_paths, config.max_workers))
 
     total = len(metas)
     
     if total == 0:
-        all_extensions = ", ".join(sorted(SUPPORTED_AUDIO_EXTENSIONS | SUPPORTED_YAML_EXTENSIONS))
+        all_extensions = ", ".join(sorted(_SCAN_EXTENSIONS))
         log_warn(_("未找到任何支持的文件（{extensions}）").format(extensions=all_extensions))
         return
     
@@ -446,9 +545,33 @@ def process_all(config: AppConfig) -> None:
         total=total, audio=audio_count, yaml=yaml_count
     ))
     
-    for idx, meta in enumerate(metas, 1):
-        log_info(_("[{idx}/{total}] 开始处理...").format(idx=idx, total=total))
-        process_track(config, api_client, meta)
-        print()
+    # 预取窗口：在处理当前曲目（等待用户输入）时，后台并发查询随后几首的
+    # /api/get-cached 与（未命中时的）/api/get。
+    # 只有一首歌时没有可重叠的等待，不启动预取线程池，直接同步查询。
+    track_metas = [TrackMeta.from_yaml(m) if isinstance(m, YamlTrackMeta) else m for m in metas]
+    window = max(1, config.max_workers)
+    prefetch = total > 1
+
+    # LRC 索引：只遍历一次 lrc_dir，之后每首歌按标题直接查找
+    lrc_index = build_lrc_index(config.lrc_dir)
+    # 需要清理空目录的根目录：每次清理都要遍历整棵目录树，因此推迟到最后统一执行一次
+    cleanup_dirs: Set[Path] = set()
+
+    # 构造时会打开本地响应缓存，紧接着进入 try，确保任何退出路径都会 close()
+    api_client = ApiClient(config)
+    try:
+        for idx, meta in enumerate(metas, 1):
+            if prefetch:
+                api_client.prefetch(track_metas[idx - 1 : idx - 1 + window])
+            log_info(_("[{idx}/{total}] 开始处理...").format(idx=idx, total=total))
+            process_track(config, api_client, meta, lrc_index=lrc_index, cleanup_dirs=cleanup_dirs)
+            print()
+            flush_logs()
+    finally:
+        api_client.close()
+        # 中途退出（q / Ctrl+C）时也清理已处理曲目留下的空目录
+        for root in sorted(cleanup_dirs):
+            cleanup_empty_dirs(root)
 
     log_info(_("全部完成。"))
+    flush_logs()
@@ -0,0 +1,222 @@
+"""
+ApiClient 单元测试
+"""
+
+import threading
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from pylrclibup.config import AppConfig
+from pylrclibup.model import TrackMeta
+from pylrclibup.api.client import ApiClient
+
+
+RECORD = {"plainLyrics": "line", "syncedLyrics": "[00:00.00]line", "instrumental": False, "duration": 180}
+
+
+@pytest.fixture
+def client(tmp_path: Path):
+    config = AppConfig(
+        tracks_dir=tmp_path,
+        lrc_dir=tmp_path,
+        done_tracks_dir=None,
+        done_lrc_dir=None,
+    )
+    api_client = ApiClient(config)
+    yield api_client
+    api_client.close()
+
+
+@pytest.fixture
+def meta(tmp_path: Path) -> TrackMeta:
+    return TrackMeta(path=tmp_path / "a.mp3", track="Song", artist="Artist", album="Album", duration=180)
+
+
+class TestPrefetch:
+    """测试 lookup 预取"""
+    
+    @patch('pylrclibup.api.client.http_request_json')
+    def test_prefetched_result_is_used(self, mock_http, client: ApiClient, meta: TrackMeta):
+        mock_http.return_value = RECORD
+        
+        client.prefetch([meta, meta])
+        record = client.get_cached(meta)
+        
+        assert record is not None
+        assert record.plain == "line"
+        assert mock_http.call_count == 1
+    
+    @patch('pylrclibup.api.client.http_request_json')
+    def test_upload_discards_prefetch(self, mock_http, client: ApiClient, meta: TrackMeta):
+        mock_http.return_value = None
+        client.prefetch([meta])
+        
+        with patch('pylrclibup.api.client._upload_instrumental_impl', return_value=True):
+            assert client.upload_instrumental(meta) is True
+        
+        mock_http.return_value = RECORD
+        assert client.get_cached(meta) is not None
+    
+    @patch('pylrclibup.api.client.http_request_json')
+    def test_prefetch_includes_external_on_miss(self, mock_http, client: ApiClient, meta: TrackMeta):
+        mock_http.side_effect = lambda config, **kw: None if kw["url"].endswith("get-cached") else RECORD
+        
+        client.prefetch([meta])
+        record, is_external = client.lookup(meta)
+        
+        assert record is not None
+        assert is_external is True
+        assert mock_http.call_count == 2
+    
+    @patch('pylrclibup.api.client.http_request_json')
+    def test_prefetch_skips_external_on_hit(self, mock_http, client: ApiClient, meta: TrackMeta):
+        mock_http.return_value = RECORD
+        
+        client.prefetch([meta])
+        record, is_external = client.lookup(meta)
+        
+        assert is_external is False
+        assert mock_http.call_count == 1
+        # 直接调用 get_external 时照常请求
+        assert client.get_external(meta) is not None
+        assert mock_http.call_count == 2
+    
+    @patch('pylrclibup.api.client.http_request_json')
+    def test_worker_label_names_track(self, mock_http, client: ApiClient, meta: TrackMeta):
+        mock_http.return_value = RECORD
+        
+        client.prefetch([meta])
+        client.get_cached(meta)
+        
+        assert "[Artist - Song]" in mock_http.call_args.kwargs["label"]
+    
+    @patch('pylrclibup.api.client.http_request_json')
+    def test_close_stops_worker_requests(self, mock_http, client: ApiClient, meta: TrackMeta):
+        started = threading.Event()
+        release = threading.Event()
+        
+        def slow_miss(config, **kw):
+            started.set()
+            release.wait(5)
+            return None
+        
+        mock_http.side_effect = slow_miss
+        client.prefetch([meta])
+        future = client._pending[client._lookup_key(meta, "get-cached")]
+        assert started.wait(5)
+        
+        client.close()
+        release.set()
+        
+        # 进行中的 /api/get-cached 结束后，不再继续请求 /api/get
+        assert future.result(timeout=5) == {"get-cached": None, "get": None}
+        assert mock_http.call_count == 1
+
+
+class TestResponseCache:
+    """测试进程内响应缓存"""
+    
+    @patch('pylrclibup.api.client.http_request_json')
+    def test_hit_is_cached(self, mock_http, client: ApiClient, meta: TrackMeta):
+        mock_http.return_value = RECORD
+        
+        first = client.get_cached(meta)
+        second = client.get_cached(meta)
+        
+        assert first == second
+        assert first is not second
+        assert mock_http.call_count == 1
+    
+    @patch('pylrclibup.api.client.http_request_json')
+    def test_miss_is_not_cached(self, mock_http, client: ApiClient, meta: TrackMeta):
+        mock_http.return_value = None
+        
+        assert client.get_cached(meta) is None
+        assert client.get_cached(meta) is None
+        assert mock_http.call_count == 2
+    
+    @patch('pylrclibup.api.client.http_request_json')
+    def test_upload_invalidates(self, mock_http, client: ApiClient, meta: TrackMeta):
+        mock_http.return_value = RECORD
+        client.get_cached(meta)
+        
+        with patch('pylrclibup.api.client._upload_lyrics_impl', return_value=True):
+            client.upload_lyrics(meta, "plain", "synced")
+        client.get_cached(meta)
+        
+        assert mock_http.call_count == 2
+
+
+class TestLookup:
+    """测试 get-cached → get 的单一查询入口"""
+    
+    @patch('pylrclibup.api.client.http_request_json')
+    def test_cached_hit_skips_external(self, mock_http, client: ApiClient, meta: TrackMeta):
+        mock_http.return_value = RECORD
+        
+        record, is_external = client.lookup(meta)
+        
+        assert record is not None
+        assert is_external is False
+        assert mock_http.call_count == 1
+    
+    @patch('pylrclibup.api.client.http_request_json')
+    def test_falls_through_to_external(self, mock_http, client: ApiClient, meta: TrackMeta):
+        mock_http.side_effect = [None, RECORD]
+        
+        record, is_external = client.lookup(meta)
+        
+        assert record is not None
+        assert is_external is True
+        assert mock_http.call_args.kwargs["url"].endswith("/get")
+    
+    @patch('pylrclibup.api.client.http_request_json')
+    def test_external_disabled(self, mock_http, client: ApiClient, meta: TrackMeta):
+        mock_http.return_value = None
+        
+        assert client.lookup(meta, allow_external=False) == (None, False)
+        assert mock_http.call_count == 1
+
+
+class TestDiskCache:
+    """测试跨运行的本地响应缓存"""
+    
+    @staticmethod
+    def _client(tmp_path: Path) -> ApiClient:
+        config = AppConfig(
+            tracks_dir=tmp_path,
+            lrc_dir=tmp_path,
+            done_tracks_dir=None,
+            done_lrc_dir=None,
+            cache_dir=tmp_path / "cache",
+        )
+        return ApiClient(config)
+    
+    @patch('pylrclibup.api.client.http_request_json')
+    def test_hit_reused_by_next_run(self, mock_http, tmp_path: Path, meta: TrackMeta):
+        mock_http.return_value = RECORD
+        first = self._client(tmp_path)
+        first.get_cached(meta)
+        first.close()
+        
+        second = self._client(tmp_path)
+        record = second.get_cached(meta)
+        second.close()
+        
+        assert record is not None
+        assert mock_http.call_count == 1
+    
+    @patch('pylrclibup.api.client._upload_lyrics_impl', return_value=True)
+    @patch('pylrclibup.api.client.http_request_json')
+    def test_upload_invalidates(self, mock_http, mock_upload, tmp_path: Path, meta: TrackMeta):
+        mock_http.return_value = RECORD
+        first = self._client(tmp_path)
+        first.get_cached(meta)
+        first.upload_lyrics(meta, "plain", "synced")
+        first.close()
+        
+        second = self._client(tmp_path)
+        second.get_cached(meta)
+        second.close()
+        
+        assert mock_http.call_count == 2
@@ -0,0 +1,83 @@
+"""
+本地响应缓存单元测试
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from pylrclibup.config import AppConfig
+from pylrclibup.api.cache import ResponseCache, open_response_cache, CACHE_FILENAME
+
+
+KEY = ("get-cached", "Song", "Artist", "Album", 180)
+DATA = {"plainLyrics": "歌词", "duration": 180}
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    c = ResponseCache(tmp_path / "cache" / CACHE_FILENAME, ttl=60)
+    yield c
+    c.close()
+
+
+class TestResponseCache:
+    """测试 ResponseCache 的读写与过期"""
+    
+    def test_roundtrip(self, cache: ResponseCache):
+        assert cache.get(KEY) is None
+        
+        cache.put(KEY, DATA)
+        
+        assert cache.get(KEY) == DATA
+        assert cache.get(("get",) + KEY[1:]) is None
+    
+    def test_persists_across_instances(self, tmp_path: Path):
+        path = tmp_path / CACHE_FILENAME
+        first = ResponseCache(path, ttl=60)
+        first.put(KEY, DATA)
+        first.close()
+        
+        second = ResponseCache(path, ttl=60)
+        try:
+            assert second.get(KEY) == DATA
+        finally:
+            second.close()
+    
+    def test_expired_entry_ignored(self, cache: ResponseCache):
+        cache.put(KEY, DATA)
+        
+        with patch('pylrclibup.api.cache.time.time', return_value=10**12):
+            assert cache.get(KEY) is None
+    
+    def test_delete(self, cache: ResponseCache):
+        cache.put(KEY, DATA)
+        
+        cache.delete(KEY)
+        
+        assert cache.get(KEY) is None
+    
+    def test_closed_cache_degrades_gracefully(self, cache: ResponseCache):
+        cache.close()
+        
+        # 关闭后（如预取线程晚于 close 执行）不应抛出异常
+        cache.put(KEY, DATA)
+        assert cache.get(KEY) is None
+
+
+class TestOpenResponseCache:
+    """测试按配置打开缓存"""
+    
+    def test_disabled_without_cache_dir(self, tmp_path: Path):
+        config = AppConfig(tracks_dir=tmp_path, lrc_dir=tmp_path, done_tracks_dir=None, done_lrc_dir=None)
+        
+        assert open_response_cache(config) is None
+    
+    def test_unusable_dir_returns_none(self, tmp_path: Path):
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+        config = AppConfig(
+            tracks_dir=tmp_path, lrc_dir=tmp_path, done_tracks_dir=None, done_lrc_dir=None,
+            cache_dir=blocker / "sub",
+        )
+        
+        assert open_response_cache(config) is None
@@ -7,7 +7,7 @@
 import pytest
 import os
 from pathlib import Path
-from pylrclibup.config import AppConfig
+from pylrclibup.config import AppConfig, MAX_HTTP_RETRIES_DEFAULT
 
 
 class TestAppConfig:
@@ -143,3 +143,15 @@ class TestAppConfig:
         config = AppConfig.from_env_and_defaults(tracks_dir=explicit_tracks)
         
         assert config.tracks_dir == explicit_tracks
+    
+    def test_numeric_env(self, monkeypatch):
+        monkeypatch.setenv("PYLRCLIBUP_PREVIEW_LINES", "3")
+        monkeypatch.setenv("PYLRCLIBUP_MAX_HTTP_RETRIES", "abc")
+        
+        config = AppConfig.from_env_and_defaults()
+        
+        assert config.preview_lines == 3
+        # 非数字的值回退到默认
+        assert config.max_http_retries == MAX_HTTP_RETRIES_DEFAULT
+        # 显式传入优先于环境变量
+        assert AppConfig.from_env_and_defaults(preview_lines=7).preview_lines == 7
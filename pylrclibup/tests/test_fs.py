@@ -6,6 +6,7 @@ import pytest
 from pathlib import Path
 from pylrclibup.fs.mover import move_with_dedup
 from pylrclibup.fs.cleaner import cleanup_empty_dirs
+from pylrclibup.fs.scanner import iter_files
 
 
 class TestMoveWithDedup:
@@ -58,6 +59,22 @@ class TestMoveWithDedup:
         assert result is not None
         assert result.name == "file_dup2.txt"
     
+    def test_dedup_fills_first_gap(self, tmp_path: Path):
+        src = tmp_path / "src" / "file.txt"
+        dst_dir = tmp_path / "dst"
+        src.parent.mkdir(parents=True)
+        dst_dir.mkdir(parents=True)
+        
+        for name in ("file.txt", "file_dup2.txt", "FILE_DUP1.TXT", "file_dup03.txt"):
+            (dst_dir / name).write_text("x")
+        
+        src.write_text("new")
+        result = move_with_dedup(src, dst_dir)
+        
+        # 名称不区分大小写比较：_dup1 视为已占用，_dup2 已存在，取 _dup3
+        assert result is not None
+        assert result.name == "file_dup3.txt"
+    
     def test_rename_on_move(self, tmp_path: Path):
         src = tmp_path / "src" / "original.lrc"
         dst_dir = tmp_path / "dst"
@@ -78,6 +95,19 @@ class TestMoveWithDedup:
         
         assert result == file
         assert file.exists()
+    
+    def test_same_file_via_symlinked_dir(self, tmp_path: Path):
+        real = tmp_path / "real"
+        real.mkdir()
+        file = real / "file.txt"
+        file.write_text("content")
+        (tmp_path / "link").symlink_to(real, target_is_directory=True)
+        
+        result = move_with_dedup(file, tmp_path / "link")
+        
+        # 目标即源文件本身，不应产生 _dup 副本
+        assert result == file
+        assert sorted(p.name for p in real.iterdir()) == ["file.txt"]
 
 
 class TestCleanupEmptyDirs:
@@ -116,3 +146,51 @@ class TestCleanupEmptyDirs:
         
         assert not (tmp_path / "empty1").exists()
         assert (tmp_path / "nonempty").exists()
+    
+    def test_symlinked_dir_not_followed(self, tmp_path: Path):
+        target = tmp_path / "target"
+        (target / "empty").mkdir(parents=True)
+        (target / "keep.txt").write_text("x")
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "link").symlink_to(target, target_is_directory=True)
+        
+        cleanup_empty_dirs(root)
+        
+        # 不进入符号链接目录，链接目标内的空目录保持不变
+        assert (target / "empty").exists()
+    
+    def test_recreate_dir_after_cleanup(self, tmp_path: Path):
+        dst_dir = tmp_path / "done" / "album"
+        first = tmp_path / "a.txt"
+        first.write_text("a")
+        moved = move_with_dedup(first, dst_dir)
+        moved.unlink()
+        
+        # 清理删除了目标目录后，再次移动到该目录时应重新创建
+        cleanup_empty_dirs(tmp_path)
+        assert not dst_dir.exists()
+        
+        second = tmp_path / "b.txt"
+        second.write_text("b")
+        
+        assert move_with_dedup(second, dst_dir) == dst_dir / "b.txt"
+
+
+class TestIterFiles:
+    """测试 iter_files 函数"""
+    
+    def test_single_pass_multiple_suffixes(self, tmp_path: Path):
+        (tmp_path / "album" / "cd1").mkdir(parents=True)
+        (tmp_path / "album" / "cd1" / "01.mp3").touch()
+        (tmp_path / "album" / "02.FLAC").touch()
+        (tmp_path / "album" / "meta.yaml").touch()
+        (tmp_path / "album" / "cover.jpg").touch()
+        (tmp_path / "album" / "dir.mp3").mkdir()
+        
+        found = sorted(p.relative_to(tmp_path).as_posix() for p in iter_files(tmp_path, {".mp3", ".flac", ".yaml"}))
+        
+        assert found == ["album/02.FLAC", "album/cd1/01.mp3", "album/meta.yaml"]
+    
+    def test_missing_root(self, tmp_path: Path):
+        assert list(iter_files(tmp_path / "missing", {".mp3"})) == []
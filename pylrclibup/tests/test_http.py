@@ -0,0 +1,202 @@
+"""
+HTTP 重试逻辑单元测试
+"""
+
+import json
+import pytest
+from pathlib import Path
+from unittest.mock import Mock, PropertyMock, patch
+from requests.exceptions import ChunkedEncodingError
+from pylrclibup.config import AppConfig
+from pylrclibup.api.http import calculate_backoff, retry_delay, http_request_json, json_loads, json_dumps, get_session, release_response
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> AppConfig:
+    return AppConfig(
+        tracks_dir=tmp_path,
+        lrc_dir=tmp_path,
+        done_tracks_dir=None,
+        done_lrc_dir=None,
+    )
+
+
+class TestBackoff:
+    """测试指数退避计算"""
+    
+    def test_exponential_growth(self, config: AppConfig):
+        config.retry_jitter = 0.0
+        
+        assert calculate_backoff(config, 1) == 0.5
+        assert calculate_backoff(config, 2) == 1.0
+        assert calculate_backoff(config, 3) == 2.0
+    
+    def test_truncated(self, config: AppConfig):
+        config.retry_jitter = 0.0
+        
+        assert calculate_backoff(config, 20) == config.retry_max_delay
+    
+    def test_jitter_bounds(self, config: AppConfig):
+        for _ in range(50):
+            delay = calculate_backoff(config, 2)
+            assert 1.0 <= delay <= 1.0 * (1 + config.retry_jitter)
+    
+    def test_retry_after_preferred(self, config: AppConfig):
+        resp = Mock(headers={"Retry-After": "3"})
+        
+        assert retry_delay(config, 1, resp) == 3.0
+    
+    def test_retry_after_capped(self, config: AppConfig):
+        resp = Mock(headers={"Retry-After": "3600"})
+        
+        assert retry_delay(config, 1, resp) == config.retry_max_delay
+    
+    def test_invalid_retry_after_falls_back(self, config: AppConfig):
+        config.retry_jitter = 0.0
+        resp = Mock(headers={"Retry-After": "soon"})
+        
+        assert retry_delay(config, 2, resp) == 1.0
+
+
+class TestHttpRequestJson:
+    """测试 http_request_json 的状态码处理"""
+    
+    @staticmethod
+    def _resp(status: int, headers=None, body=None):
+        content = json.dumps(body).encode() if body is not None else b""
+        return Mock(status_code=status, headers=headers or {}, content=content, raw=None, text="")
+    
+    @patch('pylrclibup.api.http.time.sleep')
+    @patch('pylrclibup.api.http.get_session')
+    def test_429_is_retried(self, mock_session, mock_sleep, config: AppConfig):
+        mock_session.return_value.request.side_effect = [
+            self._resp(429, {"Retry-After": "2"}),
+            self._resp(200, body={"id": 1}),
+        ]
+        
+        result = http_request_json(config, "GET", "https://example.invalid", "test")
+        
+        assert result == {"id": 1}
+        mock_sleep.assert_called_once_with(2.0)
+    
+    @patch('pylrclibup.api.http.time.sleep')
+    @patch('pylrclibup.api.http.get_session')
+    def test_other_4xx_not_retried(self, mock_session, mock_sleep, config: AppConfig):
+        mock_session.return_value.request.return_value = self._resp(400)
+        
+        result = http_request_json(config, "GET", "https://example.invalid", "test")
+        
+        assert result is None
+        assert mock_session.return_value.request.call_count == 1
+        mock_sleep.assert_not_called()
+    
+    @staticmethod
+    def _truncated_resp():
+        """200 响应，但读取响应体时连接中断（Content-Length 与实际字节数不符）"""
+        resp = Mock(status_code=200, headers={}, raw=None, text="")
+        type(resp).content = PropertyMock(
+            side_effect=ChunkedEncodingError("IncompleteRead(5 bytes read, 95 more expected)")
+        )
+        return resp
+    
+    @patch('pylrclibup.api.http.time.sleep')
+    @patch('pylrclibup.api.http.get_session')
+    def test_truncated_body_is_retried(self, mock_session, mock_sleep, config: AppConfig):
+        config.max_http_retries = 2
+        mock_session.return_value.request.side_effect = [self._truncated_resp(), self._truncated_resp()]
+        
+        result = http_request_json(config, "GET", "https://example.invalid", "test")
+        
+        assert result is None
+        assert mock_session.return_value.request.call_count == 2
+        mock_sleep.assert_called_once()
+    
+    @patch('pylrclibup.api.http.time.sleep')
+    @patch('pylrclibup.api.http.get_session')
+    def test_truncated_body_then_success(self, mock_session, mock_sleep, config: AppConfig):
+        mock_session.return_value.request.side_effect = [
+            self._truncated_resp(),
+            self._resp(200, body={"id": 1}),
+        ]
+        
+        assert http_request_json(config, "GET", "https://example.invalid", "test") == {"id": 1}
+        mock_sleep.assert_called_once()
+    
+    @patch('pylrclibup.api.http.get_session')
+    def test_404_as_none(self, mock_session, config: AppConfig):
+        mock_session.return_value.request.return_value = self._resp(404)
+        
+        assert http_request_json(config, "GET", "https://example.invalid", "test") is None
+    
+    @patch('pylrclibup.api.http.get_session')
+    def test_user_agent_from_session(self, mock_session, config: AppConfig):
+        mock_session.return_value.request.return_value = self._resp(200, body={})
+        
+        http_request_json(config, "GET", "https://example.invalid", "test")
+        
+        mock_session.assert_called_once_with(config.user_agent)
+        assert mock_session.return_value.request.call_args.kwargs["headers"] is None
+
+
+class TestReleaseResponse:
+    """测试 release_response：小响应体读完以复用连接，大的直接关闭"""
+    
+    @staticmethod
+    def _streamed(length):
+        resp = Mock(headers={} if length is None else {"Content-Length": str(length)})
+        type(resp).content = content = PropertyMock(return_value=b"")
+        return resp, content
+    
+    def test_small_body_drained(self):
+        resp, content = self._streamed(20)
+        
+        release_response(resp)
+        
+        content.assert_called_once()
+        resp.close.assert_called_once()
+    
+    @pytest.mark.parametrize("length", [None, 1 << 20])
+    def test_large_or_unknown_body_closed(self, length):
+        resp, content = self._streamed(length)
+        
+        release_response(resp)
+        
+        content.assert_not_called()
+        resp.close.assert_called_once()
+
+
+class TestSession:
+    """测试共享会话"""
+    
+    def test_user_agent_preset(self):
+        session = get_session("pylrclibup-test/1.0")
+        
+        assert session.headers["User-Agent"] == "pylrclibup-test/1.0"
+        assert get_session("pylrclibup-test/1.0") is session
+
+
+class TestJsonCodec:
+    """测试 JSON 编解码（orjson 可选）"""
+    
+    def test_parse_bytes(self):
+        assert json_loads('{"name": "歌曲"}'.encode("utf-8")) == {"name": "歌曲"}
+    
+    def test_invalid_raises_value_error(self):
+        with pytest.raises(ValueError):
+            json_loads(b"<html>")
+    
+    @patch('pylrclibup.api.http.orjson', None)
+    def test_stdlib_fallback(self):
+        assert json_loads(b'{"a": 1}') == {"a": 1}
+    
+    def test_dumps_roundtrip(self):
+        payload = {"trackName": "歌曲", "duration": 180}
+        
+        encoded = json_dumps(payload)
+        
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == payload
+    
+    @patch('pylrclibup.api.http.orjson', None)
+    def test_dumps_stdlib_fallback(self):
+        assert json_dumps({"a": "歌"}) == '{"a":"歌"}'.encode("utf-8")
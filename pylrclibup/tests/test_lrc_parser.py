@@ -2,13 +2,17 @@
 LRC 解析器单元测试
 """
 
+import re
 import pytest
 from pathlib import Path
 from pylrclibup.lrc.parser import (
     normalize_name,
     parse_lrc_file,
+    parse_many,
+    read_text_any,
     ParsedLRC,
     TIMESTAMP_RE,
+    _is_header_tag,
 )
 
 
@@ -36,6 +40,13 @@ class TestNormalizeName:
     def test_unicode_normalization(self):
         # 全角字母应转为半角
         assert normalize_name("Ａｂｃ") == "abc"
+    
+    def test_strip_invisible_chars(self):
+        # 零宽字符、控制字符与非空格分隔符被移除
+        assert normalize_name("So\u200bng") == "song"
+        assert normalize_name("歌\ufeff曲") == "歌曲"
+        assert normalize_name("a\tb\x00c") == "abc"
+        assert normalize_name("a\u3000b") == "a b"
 
 
 class TestTimestampRegex:
@@ -52,6 +63,21 @@ class TestTimestampRegex:
         assert not TIMESTAMP_RE.match("00:00.00")
 
 
+class TestHeaderTag:
+    """测试 _is_header_tag 与原头部标签正则的判断一致"""
+    
+    # 参照实现：_is_header_tag 取代的正则，仅用于等价性测试
+    HEADER_TAG_RE = re.compile(r"^\[[a-zA-Z]{2,3}:.+\]$")
+    
+    @pytest.mark.parametrize("line", [
+        "[ti:歌名]", "[ar:Artist]", "[by:x]", "[offset:+100]",
+        "[ti:]", "[t:x]", "[titl:x]", "[00:01.00]", "[t1:x]", "[ti:x", "ti:x]",
+        "[ti:x]y", "[é:x]", "[ab]", "",
+    ])
+    def test_matches_regex(self, line: str):
+        assert _is_header_tag(line) == bool(self.HEADER_TAG_RE.match(line))
+
+
 class TestParseLrcFile:
     """测试 parse_lrc_file 函数"""
     
@@ -139,3 +165,38 @@ class TestParseLrcFile:
         
         assert "Hello world" in result.plain
         assert "你好世界" in result.plain
+
+
+class TestParseMany:
+    """测试 parse_many 并发解析"""
+    
+    def test_order_preserved(self, tmp_path: Path):
+        paths = []
+        for i in range(5):
+            lrc = tmp_path / f"{i}.lrc"
+            lrc.write_text(f"[00:00.00]line {i}\n", encoding="utf-8")
+            paths.append(lrc)
+        
+        results = parse_many(paths, max_workers=3)
+        
+        assert [r.plain for r in results] == [f"line {i}" for i in range(5)]
+    
+    def test_missing_file_gives_empty_result(self, tmp_path: Path):
+        results = parse_many([tmp_path / "missing.lrc", tmp_path / "missing2.lrc"])
+        
+        assert [r.synced for r in results] == ["", ""]
+
+
+class TestReadTextAny:
+    """测试 read_text_any 的编码探测"""
+    
+    @pytest.mark.parametrize("data", [
+        "[00:00.00]歌词".encode("utf-8"),
+        "\ufeff[00:00.00]歌词".encode("utf-8"),
+        "[00:00.00]歌词".encode("gb18030"),
+    ])
+    def test_encodings(self, tmp_path: Path, data: bytes):
+        lrc = tmp_path / "test.lrc"
+        lrc.write_bytes(data)
+        
+        assert read_text_any(lrc) == "[00:00.00]歌词"
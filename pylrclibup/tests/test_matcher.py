@@ -7,8 +7,13 @@ from pathlib import Path
 from pylrclibup.lrc.matcher import (
     split_artists,
     match_artists,
-    parse_lrc_filename,
+    iter_lrc_files,
+    build_lrc_index,
+    update_lrc_index,
+    find_lrc_for_track,
 )
+from pylrclibup.config import AppConfig
+from pylrclibup.model import TrackMeta
 
 
 class TestSplitArtists:
@@ -53,6 +58,13 @@ class TestSplitArtists:
     def test_dedup(self):
         result = split_artists("A & A & B")
         assert result.count("a") == 1
+    
+    def test_cached_result_not_shared(self):
+        # 结果被缓存，但调用方修改返回的列表不影响下一次调用
+        first = split_artists("A & B")
+        first.append("c")
+        
+        assert split_artists("A & B") == ["a", "b"]
 
 
 class TestMatchArtists:
@@ -75,42 +87,82 @@ class TestMatchArtists:
         assert match_artists(["a"], []) is False
 
 
-class TestParseLrcFilename:
-    """测试 parse_lrc_filename 函数"""
+class TestIterLrcFiles:
+    """测试 iter_lrc_files 函数"""
+    
+    def test_recursive_and_case_insensitive(self, tmp_path: Path):
+        (tmp_path / "sub" / "deep").mkdir(parents=True)
+        (tmp_path / "A - One.lrc").touch()
+        (tmp_path / "sub" / "B - Two.LRC").touch()
+        (tmp_path / "sub" / "deep" / "C - Three.lrc").touch()
+        (tmp_path / "sub" / "cover.jpg").touch()
+        
+        found = {p.relative_to(tmp_path).as_posix() for p in iter_lrc_files(tmp_path)}
+        
+        assert found == {"A - One.lrc", "sub/B - Two.LRC", "sub/deep/C - Three.lrc"}
     
-    def test_standard_format(self, tmp_path: Path):
-        lrc = tmp_path / "Artist - Song.lrc"
-        lrc.touch()
+    def test_empty_dir(self, tmp_path: Path):
+        assert list(iter_lrc_files(tmp_path)) == []
+
+
+class TestLrcIndex:
+    """测试 build_lrc_index 与基于索引的 find_lrc_for_track"""
+    
+    @staticmethod
+    def _setup(tmp_path: Path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "Artist A & B - Song.lrc").touch()
+        (tmp_path / "sub" / "Other - Song.lrc").touch()
+        (tmp_path / "NoSeparator.lrc").touch()
+        config = AppConfig(tracks_dir=tmp_path, lrc_dir=tmp_path, done_tracks_dir=None, done_lrc_dir=None)
+        meta = TrackMeta(path=tmp_path / "x.mp3", track="Song", artist="B", album="", duration=1)
+        return config, meta
+    
+    def test_index_keyed_by_title(self, tmp_path: Path):
+        self._setup(tmp_path)
         
-        artists, title = parse_lrc_filename(lrc)
+        index = build_lrc_index(tmp_path)
         
-        assert "artist" in artists
-        assert title == "song"
+        assert list(index) == ["song"]
+        assert {p.name for _, p in index["song"]} == {"Artist A & B - Song.lrc", "Other - Song.lrc"}
     
-    def test_multiple_artists(self, tmp_path: Path):
-        lrc = tmp_path / "A & B - Song.lrc"
+    def test_index_splits_on_first_separator(self, tmp_path: Path):
+        lrc = tmp_path / "Artist - Song - Remix.lrc"
         lrc.touch()
         
-        artists, title = parse_lrc_filename(lrc)
+        assert build_lrc_index(tmp_path) == {"song - remix": [("Artist", lrc)]}
+    
+    def test_find_with_and_without_index(self, tmp_path: Path):
+        config, meta = self._setup(tmp_path)
+        expected = tmp_path / "Artist A & B - Song.lrc"
         
-        assert "a" in artists
-        assert "b" in artists
-        assert title == "song"
+        assert find_lrc_for_track(meta, config, interactive=False) == expected
+        assert find_lrc_for_track(meta, config, interactive=False, index=build_lrc_index(tmp_path)) == expected
     
-    def test_no_separator(self, tmp_path: Path):
-        lrc = tmp_path / "SongWithoutArtist.lrc"
-        lrc.touch()
+    def test_skips_files_moved_after_indexing(self, tmp_path: Path):
+        config, meta = self._setup(tmp_path)
+        index = build_lrc_index(tmp_path)
         
-        artists, title = parse_lrc_filename(lrc)
+        (tmp_path / "Artist A & B - Song.lrc").unlink()
         
-        assert artists == []
-        assert title == ""
+        assert find_lrc_for_track(meta, config, interactive=False, index=index) is None
     
-    def test_multiple_separators(self, tmp_path: Path):
-        lrc = tmp_path / "Artist - Song - Remix.lrc"
-        lrc.touch()
+    def test_update_after_rename_within_lrc_dir(self, tmp_path: Path):
+        self._setup(tmp_path)
+        index = build_lrc_index(tmp_path)
+        old = tmp_path / "sub" / "Other - Song.lrc"
+        new = tmp_path / "Other - Renamed.lrc"
+        
+        update_lrc_index(index, tmp_path, old, new)
+        
+        assert [p.name for _, p in index["song"]] == ["Artist A & B - Song.lrc"]
+        assert index["renamed"] == [("Other", new)]
+    
+    def test_update_after_move_out_of_lrc_dir(self, tmp_path: Path):
+        self._setup(tmp_path)
+        index = build_lrc_index(tmp_path)
         
-        artists, title = parse_lrc_filename(lrc)
+        update_lrc_index(index, tmp_path, tmp_path / "Artist A & B - Song.lrc", tmp_path.parent / "x - Song.lrc")
+        update_lrc_index(index, tmp_path, tmp_path / "sub" / "Other - Song.lrc", None)
         
-        assert "artist" in artists
-        assert title == "song - remix"
+        assert index == {}
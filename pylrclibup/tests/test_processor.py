@@ -0,0 +1,186 @@
+"""
+处理流程辅助函数单元测试
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from pylrclibup.config import AppConfig
+from pylrclibup.model import TrackMeta
+from pylrclibup.processor.core import (
+    _preview,
+    _head_and_count,
+    _confirm,
+    _get_manual_lrc_path,
+    move_files_after_processing,
+    process_all,
+)
+from pylrclibup.i18n import get_text as _
+
+
+class TestPreview:
+    """测试 _preview 函数"""
+    
+    def test_truncates_long_text(self, capsys):
+        _preview("plain", "a\nb\nc", 2)
+        
+        out = capsys.readouterr().out
+        assert out.splitlines() == ["--- plain ---", "a", "b", _("... 共 {count} 行").format(count=3), "-" * 40]
+    
+    def test_short_text_not_truncated(self, capsys):
+        _preview("plain", "a\nb", 5)
+        
+        out = capsys.readouterr().out
+        assert out.splitlines() == ["--- plain ---", "a", "b", "-" * 40]
+    
+    def test_empty_text(self, capsys):
+        _preview("synced", "", 5)
+        
+        out = capsys.readouterr().out
+        assert out.splitlines() == ["--- synced ---", _("[空]"), "-" * 40]
+    
+    def test_zero_lines_disables_preview(self, capsys):
+        _preview("plain", "a\nb", 0)
+        
+        assert capsys.readouterr().out == ""
+
+
+class TestHeadAndCount:
+    """测试 _head_and_count 与 str.splitlines() 结果一致"""
+    
+    @pytest.mark.parametrize("text", ["a", "a\n", "a\nb", "a\n\nb\n", "\n", "a\r\nb\r\n", "a\rb", "a\u2028b\n"])
+    @pytest.mark.parametrize("n", [1, 2, 5])
+    def test_matches_splitlines(self, text: str, n: int):
+        lines = text.splitlines()
+        
+        assert _head_and_count(text, n) == (lines[:n], len(lines))
+
+
+class TestConfirm:
+    """测试 [y/N] 确认提示"""
+    
+    @pytest.mark.parametrize("answer", ["y", "Y", " yes ", "是"])
+    def test_yes(self, answer: str):
+        with patch("builtins.input", return_value=answer):
+            assert _confirm("?") is True
+    
+    @pytest.mark.parametrize("answer", ["", "n", "no", "否", "yy"])
+    def test_anything_else_is_no(self, answer: str):
+        with patch("builtins.input", return_value=answer):
+            assert _confirm("?") is False
+
+
+class TestGetManualLrcPath:
+    """测试手动输入 LRC 路径"""
+    
+    @pytest.mark.parametrize("quote", ["'", '"'])
+    def test_strips_matching_quotes(self, tmp_path: Path, quote: str):
+        lrc = tmp_path / "a b.lrc"
+        lrc.touch()
+        
+        with patch("builtins.input", return_value=f"{quote}{lrc}{quote}"):
+            assert _get_manual_lrc_path() == lrc.resolve()
+    
+    def test_relative_path_uses_cwd(self, tmp_path: Path, monkeypatch):
+        (tmp_path / "a.lrc").touch()
+        monkeypatch.chdir(tmp_path)
+        
+        with patch("builtins.input", return_value="a.lrc"):
+            assert _get_manual_lrc_path() == (tmp_path / "a.lrc").resolve()
+        with patch("builtins.input", return_value="missing.lrc"):
+            assert _get_manual_lrc_path() is None
+    
+    def test_non_lrc_suffix_needs_confirmation(self, tmp_path: Path):
+        txt = tmp_path / "a.txt"
+        txt.touch()
+        
+        with patch("builtins.input", side_effect=[str(txt), "YES"]):
+            assert _get_manual_lrc_path() == txt.resolve()
+        with patch("builtins.input", side_effect=[str(txt), "n"]):
+            assert _get_manual_lrc_path() is None
+
+
+class TestMoveFilesAfterProcessing:
+    """测试处理后的文件移动与空目录清理"""
+    
+    @staticmethod
+    def _setup(tmp_path: Path):
+        tracks = tmp_path / "tracks"
+        (tracks / "sub").mkdir(parents=True)
+        audio = tracks / "sub" / "a.mp3"
+        audio.touch()
+        config = AppConfig(
+            tracks_dir=tracks,
+            lrc_dir=tracks,
+            done_tracks_dir=tmp_path / "done",
+            done_lrc_dir=None,
+        )
+        meta = TrackMeta(path=audio, track="Song", artist="Artist", album="Album", duration=1)
+        return config, meta
+    
+    def test_cleans_up_immediately_by_default(self, tmp_path: Path):
+        config, meta = self._setup(tmp_path)
+        
+        move_files_after_processing(config, meta, None)
+        
+        assert (tmp_path / "done" / "a.mp3").exists()
+        assert not (config.tracks_dir / "sub").exists()
+    
+    def test_deferred_cleanup_only_records_roots(self, tmp_path: Path):
+        config, meta = self._setup(tmp_path)
+        cleanup_dirs = set()
+        
+        move_files_after_processing(config, meta, None, cleanup_dirs=cleanup_dirs)
+        
+        assert (tmp_path / "done" / "a.mp3").exists()
+        assert (config.tracks_dir / "sub").exists()
+        assert cleanup_dirs == {config.tracks_dir}
+    
+    def test_nothing_moved_skips_cleanup(self, tmp_path: Path):
+        config, meta = self._setup(tmp_path)
+        config.done_tracks_dir = None
+        (config.tracks_dir / "empty").mkdir()
+        cleanup_dirs = set()
+        
+        move_files_after_processing(config, meta, None, cleanup_dirs=cleanup_dirs)
+        move_files_after_processing(config, meta, None)
+        
+        assert cleanup_dirs == set()
+        assert (config.tracks_dir / "empty").exists()
+
+
+class TestProcessAll:
+    """测试批量处理入口"""
+    
+    @staticmethod
+    def _run(tmp_path: Path, count: int):
+        config = AppConfig(tracks_dir=tmp_path, lrc_dir=tmp_path, done_tracks_dir=None, done_lrc_dir=None)
+        paths = [tmp_path / f"{i}.mp3" for i in range(count)]
+        metas = {p: TrackMeta(path=p, track=p.stem, artist="A", album="B", duration=1) for p in paths}
+        with patch("pylrclibup.processor.core.iter_files", return_value=paths), \
+             patch("pylrclibup.processor.core.TrackMeta.from_audio_file", side_effect=metas.get), \
+             patch("pylrclibup.processor.core.ApiClient") as mock_client, \
+             patch("pylrclibup.processor.core.process_track") as mock_process:
+            process_all(config)
+        return mock_client.return_value, mock_process
+    
+    def test_single_track_skips_prefetch(self, tmp_path: Path):
+        client, mock_process = self._run(tmp_path, 1)
+        
+        assert mock_process.call_count == 1
+        client.prefetch.assert_not_called()
+        client.close.assert_called_once()
+    
+    def test_batch_prefetches(self, tmp_path: Path):
+        client, mock_process = self._run(tmp_path, 3)
+        
+        assert mock_process.call_count == 3
+        assert client.prefetch.call_count == 3
+    
+    def test_no_files_skips_api_client(self, tmp_path: Path):
+        config = AppConfig(tracks_dir=tmp_path, lrc_dir=tmp_path, done_tracks_dir=None, done_lrc_dir=None)
+        with patch("pylrclibup.processor.core.iter_files", return_value=[]), \
+             patch("pylrclibup.processor.core.ApiClient") as mock_client:
+            process_all(config)
+        
+        mock_client.assert_not_called()
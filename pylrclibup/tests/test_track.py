@@ -17,7 +17,7 @@ class TestTrackMetaMultiFormat:
     def test_mp3_format(self, mock_muta, tmp_path: Path):
         """测试 MP3 格式（ID3v2 标签）"""
         audio_file = tmp_path / "test.mp3"
-        audio_file.touch()
+        audio_file.write_bytes(b"ID3\x04\x00" + b"\x00" * 5)
         
         # 模拟 MP3 标签结构
         mock_audio = Mock()
@@ -90,7 +90,7 @@ class TestTrackMetaMultiFormat:
     def test_missing_tags(self, mock_muta, tmp_path: Path):
         """测试标签不完整的情况"""
         audio_file = tmp_path / "incomplete.mp3"
-        audio_file.touch()
+        audio_file.write_bytes(b"ID3\x04\x00" + b"\x00" * 5)
         
         mock_audio = Mock()
         mock_audio.tags = {
@@ -108,7 +108,7 @@ class TestTrackMetaMultiFormat:
     def test_invalid_duration(self, mock_muta, tmp_path: Path):
         """测试无效时长"""
         audio_file = tmp_path / "invalid.mp3"
-        audio_file.touch()
+        audio_file.write_bytes(b"ID3\x04\x00" + b"\x00" * 5)
         
         mock_audio = Mock()
         mock_audio.tags = {
@@ -123,6 +123,28 @@ class TestTrackMetaMultiFormat:
         
         assert result is None
     
+    @patch('pylrclibup.model.track.MutaFile')
+    def test_untagged_mp3_skips_parser(self, mock_muta, tmp_path: Path):
+        """测试无 ID3 标签的 MP3 不调用 mutagen"""
+        audio_file = tmp_path / "raw.mp3"
+        audio_file.write_bytes(b"\xff\xfb" + b"\x00" * 300)
+        
+        result = TrackMeta.from_audio_file(audio_file)
+        
+        assert result is None
+        mock_muta.assert_not_called()
+    
+    @patch('pylrclibup.model.track.MutaFile')
+    def test_id3v1_only_mp3_is_parsed(self, mock_muta, tmp_path: Path):
+        """测试只有 ID3v1 标签（文件末尾 TAG）的 MP3 仍交给 mutagen"""
+        audio_file = tmp_path / "v1.mp3"
+        audio_file.write_bytes(b"\xff\xfb" + b"\x00" * 300 + b"TAG" + b"\x00" * 125)
+        mock_muta.return_value = None
+        
+        TrackMeta.from_audio_file(audio_file)
+        
+        mock_muta.assert_called_once_with(audio_file)
+    
     def test_from_mp3_backward_compatibility(self, tmp_path: Path):
         """测试 from_mp3() 向后兼容性"""
         with patch('pylrclibup.model.track.TrackMeta.from_audio_file') as mock_from_audio: